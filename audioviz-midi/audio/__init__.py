@@ -7,5 +7,6 @@ Handles audio loading, pitch detection, and onset detection.
 from .audio_loader import AudioLoader
 from .pitch_detector import PitchDetector
 from .onset_detector import OnsetDetector
+from .feature_cache import FeatureCache
 
-__all__ = ['AudioLoader', 'PitchDetector', 'OnsetDetector']
+__all__ = ['AudioLoader', 'PitchDetector', 'OnsetDetector', 'FeatureCache']
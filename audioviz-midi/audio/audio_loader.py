@@ -5,16 +5,83 @@ Handles loading and preprocessing of audio files in various formats.
 Supports WAV, MP3, FLAC, and OGG formats with automatic preprocessing.
 """
 
-import librosa
+import lazy_loader as lazy
 import numpy as np
 import soundfile as sf
+import soxr
 import os
-from typing import Tuple, Optional
+import hashlib
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from numba import njit, prange
+from typing import List, Tuple, Optional
 from utils.logger import get_logger
 from utils.config import ConfigManager
 
 logger = get_logger(__name__)
 
+# Imported on first use so AudioLoader can set LIBROSA_CACHE_* beforehand
+librosa = lazy.load('librosa')
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _max_abs_numba(y):
+    """
+    Compute the peak absolute value of a 1-D float array in one pass.
+    
+    Args:
+        y: Contiguous 1-D audio buffer
+    
+    Returns:
+        Peak absolute value
+    """
+    # numba turns max= inside prange into a parallel reduction
+    m = 0.0
+    for i in prange(y.shape[0]):
+        m = max(m, abs(y[i]))
+    return m
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _abs_stats(y):
+    """
+    Compute peak and mean absolute value of a 1-D array in one pass.
+    
+    Args:
+        y: 1-D audio buffer
+    
+    Returns:
+        Tuple of (max_abs, mean_abs)
+    """
+    n = y.shape[0]
+    if n == 0:
+        return 0.0, 0.0
+    
+    mx = 0.0
+    total = 0.0
+    for i in prange(n):
+        a = abs(y[i])
+        mx = max(mx, a)
+        total += a
+    return mx, total / n
+
+
+def _default_cache_dir() -> str:
+    """
+    Get the per-user cache directory for decoded audio.
+    
+    Returns:
+        <user cache dir>/audioviz-midi (XDG_CACHE_HOME, LOCALAPPDATA on
+        Windows, otherwise ~/.cache)
+    """
+    base = (
+        os.environ.get('XDG_CACHE_HOME')
+        or os.environ.get('LOCALAPPDATA')
+        or os.path.join(os.path.expanduser('~'), '.cache')
+    )
+    return os.path.join(base, 'audioviz-midi')
+
 
 class AudioLoader:
     """
@@ -30,6 +97,9 @@ class AudioLoader:
     # Supported audio file formats
     SUPPORTED_FORMATS = ['.wav', '.mp3', '.flac', '.ogg']
     
+    # Formats decoded directly by libsndfile (others fall back to librosa)
+    NATIVE_FORMATS = ('.wav', '.flac', '.ogg')
+    
     def __init__(self, config: Optional[ConfigManager] = None):
         """
         Initialize the Audio Loader.
@@ -43,6 +113,18 @@ class AudioLoader:
         self.target_sample_rate = self.config.get('audio', 'sample_rate', 22050)
         self.normalize = self.config.get('audio', 'normalize', True)
         self.mono_conversion = self.config.get('audio', 'mono_conversion', True)
+        self.cache_decoded = self.config.get('audio', 'cache_decoded', True)
+        self.cache_dir = self.config.get('audio', 'cache_dir', None)
+        
+        # Enable librosa's function cache when a cache directory is configured.
+        # librosa reads these at import time, which is deferred until first use.
+        if self.cache_dir:
+            os.environ.setdefault('LIBROSA_CACHE_DIR', self.cache_dir)
+            os.environ.setdefault('LIBROSA_CACHE_LEVEL', '50')
+        
+        # soxr resamplers keyed by (native_rate, channels); the target rate is
+        # fixed per loader, so filter tables are built once per source rate
+        self._resamplers = {}
         
         # Current loaded audio data
         self.audio_data = None
@@ -53,12 +135,14 @@ class AudioLoader:
         logger.info("AudioLoader initialized")
         logger.debug(f"Target sample rate: {self.target_sample_rate} Hz")
     
-    def load_audio(self, filepath: str) -> Tuple[np.ndarray, int]:
+    def load_audio(self, filepath: str, lazy: bool = False) -> Tuple[np.ndarray, int]:
         """
         Load and preprocess audio file.
         
         Args:
             filepath: Path to audio file
+            lazy: Stream WAV/FLAC/OGG into a disk-backed memmap instead of RAM.
+                Only applies when no resampling is needed.
         
         Returns:
             Tuple of (audio_data, sample_rate)
@@ -87,22 +171,43 @@ class AudioLoader:
             )
         
         try:
-            # Load audio using librosa (handles all formats and preprocessing)
-            logger.debug("Loading audio with librosa...")
-            audio_data, sample_rate = librosa.load(
-                filepath,
-                sr=self.target_sample_rate,  # Resample to target rate
-                mono=self.mono_conversion     # Convert to mono if needed
-            )
-            
-            logger.info(f"Audio loaded successfully")
-            logger.debug(f"Original sample rate: {sample_rate} Hz")
-            logger.debug(f"Audio shape: {audio_data.shape}")
-            logger.debug(f"Audio duration: {len(audio_data) / sample_rate:.2f} seconds")
-            
-            # Apply preprocessing
-            audio_data = self._preprocess(audio_data)
+            lazy_result = None
+            if lazy and file_extension in self.NATIVE_FORMATS:
+                lazy_result = self._load_lazy(filepath)
             
+            if lazy_result is not None:
+                # Already downmixed and normalized block by block
+                audio_data, sample_rate = lazy_result
+            else:
+                # The cache key pins the sample rate, so native-rate loads skip it
+                use_cache = self.cache_decoded and bool(self.target_sample_rate)
+                cached = self._load_cached(filepath) if use_cache else None
+                
+                if cached is not None:
+                    audio_data, sample_rate = cached
+                else:
+                    if file_extension in self.NATIVE_FORMATS:
+                        audio_data, sample_rate = self._load_native(filepath)
+                    else:
+                        # Load audio using librosa (audioread backend for MP3)
+                        logger.debug("Loading audio with librosa...")
+                        audio_data, sample_rate = librosa.load(
+                            filepath,
+                            sr=self.target_sample_rate,  # Resample to target rate
+                            mono=self.mono_conversion     # Convert to mono if needed
+                        )
+                
+                    if use_cache:
+                        self._save_cached(filepath, audio_data)
+                
+                logger.info(f"Audio loaded successfully")
+                logger.debug(f"Original sample rate: {sample_rate} Hz")
+                logger.debug(f"Audio shape: {audio_data.shape}")
+                logger.debug(f"Audio duration: {len(audio_data) / sample_rate:.2f} seconds")
+                
+                # Apply preprocessing
+                audio_data = self._preprocess(audio_data)
+                
             # Store loaded audio information
             self.audio_data = audio_data
             self.sample_rate = sample_rate
@@ -117,6 +222,235 @@ class AudioLoader:
             logger.error(f"Error loading audio file: {str(e)}")
             raise Exception(f"Failed to load audio: {str(e)}")
     
+    def load_many(self,
+                  filepaths: List[str],
+                  max_workers: Optional[int] = None) -> List[Tuple[np.ndarray, int]]:
+        """
+        Load several audio files concurrently.
+        
+        libsndfile decoding and soxr resampling release the GIL, so a thread
+        pool overlaps I/O and decode work across files. Each worker thread
+        uses its own AudioLoader since load_audio stores per-file state.
+        
+        Args:
+            filepaths: Paths to audio files
+            max_workers: Maximum number of worker threads (default: CPU count)
+        
+        Returns:
+            List of (audio_data, sample_rate) tuples in input order
+        """
+        logger.info(f"Loading {len(filepaths)} audio files in parallel")
+        
+        local = threading.local()
+        
+        def _load(filepath: str) -> Tuple[np.ndarray, int]:
+            if not hasattr(local, 'loader'):
+                local.loader = AudioLoader(self.config)
+            return local.loader.load_audio(filepath)
+        
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(_load, filepaths))
+    
+    def _get_cache_path(self, filepath: str) -> str:
+        """
+        Build the cache file path for a source audio file.
+        
+        The name embeds a hash of everything that affects the decoded
+        output, so edits to the file or loader settings miss the cache.
+        
+        Args:
+            filepath: Path to audio file
+        
+        Returns:
+            Path of the .npy cache file
+        """
+        stat = os.stat(filepath)
+        key = repr((
+            os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size,
+            self.target_sample_rate, self.mono_conversion
+        ))
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        
+        cache_dir = self.cache_dir or _default_cache_dir()
+        return os.path.join(cache_dir, f"{os.path.basename(filepath)}.{digest}.npy")
+    
+    def _load_cached(self, filepath: str) -> Optional[Tuple[np.ndarray, int]]:
+        """
+        Load previously decoded audio from the cache.
+        
+        Args:
+            filepath: Path to audio file
+        
+        Returns:
+            Tuple of (audio_data, sample_rate) or None on a cache miss
+        """
+        try:
+            cache_path = self._get_cache_path(filepath)
+            if not os.path.exists(cache_path):
+                return None
+            
+            cached = np.load(cache_path, mmap_mode='r')
+            if cached.dtype != np.float32:
+                # Stale cache from an older format; it gets rewritten on this load
+                return None
+            
+            # Copy out of the memmap into a fresh writable buffer
+            audio_data = np.array(cached)
+        except Exception as e:
+            logger.warning(f"Could not read audio cache: {str(e)}")
+            return None
+        
+        logger.debug(f"Loaded decoded audio from cache: {cache_path}")
+        return audio_data, self.target_sample_rate
+    
+    def _save_cached(self, filepath: str, audio_data: np.ndarray):
+        """
+        Write decoded audio to the cache atomically.
+        
+        Samples are stored as float32 exactly as decoded (before
+        normalization), so a cached load returns the same signal as a
+        fresh decode.
+        
+        Args:
+            filepath: Path to audio file
+            audio_data: Decoded audio data array
+        """
+        try:
+            cache_path = self._get_cache_path(filepath)
+            cache_dir = os.path.dirname(cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            
+            # Write to a temp file in the same directory, then rename, so a
+            # concurrent reader never sees a partially written file
+            fd, tmp_path = tempfile.mkstemp(suffix='.npy.tmp', dir=cache_dir)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    np.save(f, np.asarray(audio_data, dtype=np.float32))
+                os.replace(tmp_path, cache_path)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+            
+            logger.debug(f"Cached decoded audio: {cache_path}")
+        except Exception as e:
+            # Don't retry the write on every load (e.g. read-only cache dir)
+            logger.warning(f"Could not write audio cache, disabling it: {str(e)}")
+            self.cache_decoded = False
+    
+    def _load_lazy(self, filepath: str,
+                   block_size: int = 1 << 20) -> Optional[Tuple[np.ndarray, int]]:
+        """
+        Stream a WAV/FLAC/OGG file into a memmap backed by a temporary file.
+        
+        Downmixing and normalization are done block by block so the full
+        signal never has to be resident in memory.
+        
+        Args:
+            filepath: Path to audio file
+            block_size: Number of frames decoded per block
+        
+        Returns:
+            Tuple of (audio_data, sample_rate), or None if the file needs
+            resampling (the caller then falls back to an eager load)
+        """
+        with sf.SoundFile(filepath) as f:
+            sample_rate = f.samplerate
+            if self.target_sample_rate and sample_rate != self.target_sample_rate:
+                logger.debug("Lazy load needs resampling, falling back to eager load")
+                return None
+            
+            mono = self.mono_conversion or f.channels == 1
+            shape = (f.frames,) if mono else (f.channels, f.frames)
+            
+            # The temp file is unlinked on close; the mapping keeps it alive
+            with tempfile.TemporaryFile() as backing:
+                audio_data = np.memmap(backing, dtype=np.float32, mode='w+', shape=shape)
+            
+            logger.debug(f"Streaming {f.frames} frames into memmap")
+            
+            offset = 0
+            peak = 0.0
+            for block in f.blocks(blocksize=block_size, dtype='float32', always_2d=True):
+                n = block.shape[0]
+                if mono:
+                    block = block.mean(axis=1, dtype=np.float32)
+                    audio_data[offset:offset + n] = block
+                else:
+                    audio_data[:, offset:offset + n] = block.T
+                peak = max(peak, float(np.abs(block).max()))
+                offset += n
+        
+        if self.normalize:
+            if peak > 0:
+                scale = np.float32(1.0 / peak)
+                for start in range(0, shape[-1], block_size):
+                    audio_data[..., start:start + block_size] *= scale
+                logger.debug(f"Audio normalized. Max value was: {peak:.4f}")
+            else:
+                logger.warning("Audio contains only silence, skipping normalization")
+        
+        audio_data.flush()
+        
+        return audio_data, sample_rate
+    
+    def _get_resampler(self, native_rate: int, num_channels: int) -> soxr.ResampleStream:
+        """
+        Get a cached soxr resampler for a source rate and channel count.
+        
+        Args:
+            native_rate: Sample rate of the source file in Hz
+            num_channels: Number of channels being resampled
+        
+        Returns:
+            ResampleStream converting to the target sample rate
+        """
+        key = (native_rate, num_channels)
+        resampler = self._resamplers.get(key)
+        if resampler is None:
+            resampler = soxr.ResampleStream(
+                native_rate, self.target_sample_rate, num_channels,
+                dtype='float32', quality='HQ'
+            )
+            self._resamplers[key] = resampler
+        return resampler
+    
+    def _load_native(self, filepath: str) -> Tuple[np.ndarray, int]:
+        """
+        Decode a WAV/FLAC/OGG file with soundfile and resample with soxr.
+        
+        Produces the same layout as librosa.load: 1-D when mono,
+        (channels, samples) otherwise.
+        
+        Args:
+            filepath: Path to audio file
+        
+        Returns:
+            Tuple of (audio_data, sample_rate)
+        """
+        logger.debug("Loading audio with soundfile...")
+        audio_data, native_rate = sf.read(filepath, dtype='float32', always_2d=False)
+        logger.debug(f"Native sample rate: {native_rate} Hz")
+        
+        # Downmix before resampling so soxr only processes one channel
+        if audio_data.ndim == 2 and self.mono_conversion:
+            audio_data = audio_data.mean(axis=1, dtype=np.float32)
+        
+        # Resample only when the file isn't already at the target rate
+        sample_rate = native_rate
+        if self.target_sample_rate and native_rate != self.target_sample_rate:
+            logger.debug(f"Resampling {native_rate} Hz -> {self.target_sample_rate} Hz")
+            num_channels = 1 if audio_data.ndim == 1 else audio_data.shape[1]
+            resampler = self._get_resampler(native_rate, num_channels)
+            resampler.clear()
+            audio_data = resampler.resample_chunk(audio_data, last=True)
+            sample_rate = self.target_sample_rate
+        
+        # soundfile is (samples, channels); librosa convention is (channels, samples)
+        if audio_data.ndim == 2:
+            audio_data = audio_data.T
+        
+        return audio_data, sample_rate
+    
     def _preprocess(self, audio_data: np.ndarray) -> np.ndarray:
         """
         Apply preprocessing steps to audio data.
@@ -137,28 +471,37 @@ class AudioLoader:
         # Additional preprocessing can be added here
         # (e.g., filtering, noise reduction)
         
+        # Downstream SIMD/numba code expects contiguous float32 samples
+        audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+        
         return audio_data
     
     def _normalize_audio(self, audio_data: np.ndarray) -> np.ndarray:
         """
         Normalize audio to have maximum absolute value of 1.0.
         
+        Uses a single read pass for the peak and a single in-place write
+        pass for the scaling, instead of allocating abs/divide temporaries.
+        
         Args:
             audio_data: Audio data array
         
         Returns:
             Normalized audio data array
         """
-        max_val = np.abs(audio_data).max()
+        # Scale in place on a contiguous float32 buffer
+        audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+        flat = audio_data.reshape(-1)
+        max_val = _max_abs_numba(flat)
         
         if max_val > 0:
-            # Normalize to range [-1.0, 1.0]
-            normalized = audio_data / max_val
+            # In-place multiply: no temporary array
+            flat *= np.float32(1.0 / max_val)
             logger.debug(f"Audio normalized. Max value was: {max_val:.4f}")
-            return normalized
         else:
             logger.warning("Audio contains only silence, skipping normalization")
-            return audio_data
+        
+        return audio_data
     
     def get_audio_info(self) -> dict:
         """
@@ -171,13 +514,15 @@ class AudioLoader:
             logger.warning("No audio loaded")
             return {}
         
+        max_amplitude, mean_amplitude = _abs_stats(np.asarray(self.audio_data).reshape(-1))
+        
         return {
             'filename': self.filename,
             'duration': self.duration,
             'sample_rate': self.sample_rate,
             'num_samples': len(self.audio_data),
-            'max_amplitude': float(np.abs(self.audio_data).max()),
-            'mean_amplitude': float(np.abs(self.audio_data).mean())
+            'max_amplitude': float(max_amplitude),
+            'mean_amplitude': float(mean_amplitude)
         }
     
     def validate_file(self, filepath: str) -> Tuple[bool, str]:
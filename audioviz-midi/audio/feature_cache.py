@@ -0,0 +1,107 @@
+# audio/feature_cache.py
+"""
+Feature Cache Module for AudioViz MIDI.
+Computes spectral features once per audio file and shares them between
+the pitch and onset detectors so the signal is only transformed once.
+"""
+
+import lazy_loader as lazy
+import numpy as np
+from typing import Optional
+from utils.logger import get_logger
+from .fft_backend import fft_backend
+
+logger = get_logger(__name__)
+
+# Imported on first use so AudioLoader can set LIBROSA_CACHE_* beforehand
+librosa = lazy.load('librosa')
+
+
+class FeatureCache:
+    """
+    Lazily computed STFT and mel-spectrogram for one audio signal.
+    
+    Each feature is computed on first access and kept for later readers:
+    - stft: Complex STFT
+    - magnitude: |STFT| (used by piptrack)
+    - mel_power: Mel power spectrogram
+    - log_mel: Log-power mel spectrogram in dB (used by onset detection)
+    """
+    
+    def __init__(self,
+                 audio_data: np.ndarray,
+                 sample_rate: int,
+                 hop_length: int = 512,
+                 n_fft: int = 2048,
+                 n_mels: int = 128):
+        """
+        Initialize the Feature Cache.
+        
+        Args:
+            audio_data: Audio signal as numpy array (mono)
+            sample_rate: Sample rate in Hz
+            hop_length: Number of samples between analysis frames
+            n_fft: FFT window size
+            n_mels: Number of mel bands
+        """
+        self.audio_data = audio_data
+        self.sample_rate = sample_rate
+        self.hop_length = hop_length
+        self.n_fft = n_fft
+        self.n_mels = n_mels
+        
+        self._stft = None
+        self._magnitude = None
+        self._mel_power = None
+        self._log_mel = None
+        
+        logger.debug(f"FeatureCache created (n_fft={n_fft}, hop_length={hop_length})")
+    
+    @property
+    def stft(self) -> np.ndarray:
+        """Complex STFT of the signal."""
+        if self._stft is None:
+            logger.debug("Computing STFT")
+            with fft_backend():
+                self._stft = librosa.stft(
+                    self.audio_data, n_fft=self.n_fft, hop_length=self.hop_length
+                )
+        return self._stft
+    
+    @property
+    def magnitude(self) -> np.ndarray:
+        """Magnitude spectrogram |STFT|."""
+        if self._magnitude is None:
+            self._magnitude = np.abs(self.stft)
+        return self._magnitude
+    
+    @property
+    def mel_power(self) -> np.ndarray:
+        """Mel power spectrogram."""
+        if self._mel_power is None:
+            logger.debug("Computing mel spectrogram")
+            self._mel_power = librosa.feature.melspectrogram(
+                S=self.magnitude ** 2, sr=self.sample_rate,
+                n_fft=self.n_fft, n_mels=self.n_mels
+            )
+        return self._mel_power
+    
+    @property
+    def log_mel(self) -> np.ndarray:
+        """Log-power mel spectrogram in dB, as expected by onset_strength."""
+        if self._log_mel is None:
+            self._log_mel = librosa.power_to_db(self.mel_power)
+        return self._log_mel
+    
+    def matches(self, hop_length: int, n_fft: Optional[int] = None) -> bool:
+        """
+        Check whether cached features use the given frame parameters.
+        
+        Args:
+            hop_length: Hop length the caller analyzes with
+            n_fft: FFT size the caller analyzes with (None = any)
+        
+        Returns:
+            True if the cached features can be reused
+        """
+        return hop_length == self.hop_length and (n_fft is None or n_fft == self.n_fft)
@@ -5,14 +5,82 @@ Identifies note start times (onsets) within audio signals.
 Analyzes amplitude envelopes and spectral changes to detect when notes begin.
 """
 
-import librosa
+import lazy_loader as lazy
 import numpy as np
+from numba import njit, prange
 from typing import List, Tuple, Optional
 from utils.logger import get_logger
 from utils.config import ConfigManager
+from .feature_cache import FeatureCache
+from .fft_backend import fft_backend
 
 logger = get_logger(__name__)
 
+# Imported on first use so AudioLoader can set LIBROSA_CACHE_* beforehand
+librosa = lazy.load('librosa')
+
+
+@njit(cache=True)
+def _greedy_filter(times, min_dt):
+    """
+    Keep each onset that is at least min_dt after the last kept onset.
+    
+    Args:
+        times: Sorted 1-D array of onset times in seconds
+        min_dt: Minimum spacing between kept onsets in seconds
+    
+    Returns:
+        Array of kept onset times
+    """
+    n = times.shape[0]
+    out = np.empty(n, dtype=np.int64)
+    if n == 0:
+        return times[out[:0]]
+    
+    out[0] = 0
+    k = 1
+    last = times[0]
+    for i in range(1, n):
+        if times[i] - last >= min_dt:
+            out[k] = i
+            k += 1
+            last = times[i]
+    
+    return times[out[:k]]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _flux_envelope(M, pad):
+    """
+    Spectral-flux onset envelope of a (bins, frames) spectrogram.
+    
+    Matches librosa's onset_strength with lag=1, max_size=1 and mean
+    aggregation: the mean positive difference between consecutive frames,
+    delayed by pad frames and trimmed to the input length.
+    
+    Args:
+        M: 2-D spectrogram (e.g. log-power mel), bins x frames
+        pad: Number of leading zero frames (lag + centering offset)
+    
+    Returns:
+        Onset envelope with one value per input frame
+    """
+    n_bins, n_frames = M.shape
+    env = np.zeros(n_frames, dtype=np.float32)
+    
+    # Flux between frames t-1 and t lands at t - 1 + pad
+    for t in prange(1, n_frames):
+        dst = t - 1 + pad
+        if dst < n_frames:
+            acc = 0.0
+            for f in range(n_bins):
+                d = M[f, t] - M[f, t - 1]
+                if d > 0.0:
+                    acc += d
+            env[dst] = acc / n_bins
+    
+    return env
+
 
 class OnsetDetector:
     """
@@ -48,6 +116,15 @@ class OnsetDetector:
         self.onset_frames = None
         self.onset_strength = None
         
+        # Spectrogram work buffers, grown on demand and reused across calls
+        self.n_fft = 2048
+        self.n_mels = 128
+        self._stft_buf = None
+        self._power_buf = None
+        self._mel_buf = None
+        self._mel_basis = None
+        self._mel_basis_key = None
+        
         logger.info("OnsetDetector initialized")
         logger.debug(f"Hop length: {self.hop_length} samples")
         logger.debug(f"Minimum note duration: {self.min_note_duration} seconds")
@@ -55,7 +132,10 @@ class OnsetDetector:
     def detect_onsets(self, 
                      audio_data: np.ndarray, 
                      sample_rate: int,
-                     method: str = 'energy') -> Tuple[np.ndarray, np.ndarray]:
+                     method: str = 'energy',
+                     aggregate=np.median,
+                     S: Optional[np.ndarray] = None,
+                     feature_cache: Optional[FeatureCache] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Detect note onset times in audio signal.
         
@@ -63,6 +143,13 @@ class OnsetDetector:
             audio_data: Audio signal as numpy array (mono)
             sample_rate: Sample rate in Hz (typically 22050)
             method: Detection method - 'energy', 'rms', 'complex', 'phase', 'hfc', 'flux'
+            aggregate: Function aggregating onset strength across frequency bins.
+                np.median (default) is the most robust; np.mean is faster
+                (fused numba kernel) but picks up more spurious onsets
+            S: Optional precomputed log-power mel spectrogram (dB) computed with
+                this detector's hop length; skips the internal STFT when given
+            feature_cache: Optional shared FeatureCache; its log-mel spectrogram
+                is used as S when the frame parameters match
         
         Returns:
             Tuple of (onset_times, onset_strength)
@@ -79,15 +166,30 @@ class OnsetDetector:
         
         self.method = method
         
+        if S is None and feature_cache is not None:
+            if feature_cache.matches(self.hop_length, self.n_fft):
+                S = feature_cache.log_mel
+            else:
+                logger.warning("Feature cache frame parameters differ, ignoring it")
+        
         try:
             # Compute onset strength envelope
             # This represents how likely an onset is at each time frame
-            onset_env = librosa.onset.onset_strength(
-                y=audio_data,
-                sr=sample_rate,
-                hop_length=self.hop_length,
-                aggregate=np.median
-            )
+            if S is None:
+                S = self._compute_log_mel(audio_data, sample_rate)
+            
+            if aggregate is np.mean:
+                # Default flux envelope without librosa's per-call dispatch
+                pad = 1 + self.n_fft // (2 * self.hop_length)
+                onset_env = _flux_envelope(S, pad)
+            else:
+                onset_env = librosa.onset.onset_strength(
+                    sr=sample_rate,
+                    S=S,
+                    n_fft=self.n_fft,
+                    hop_length=self.hop_length,
+                    aggregate=aggregate
+                )
             
             logger.debug(f"Onset strength envelope computed: {len(onset_env)} frames")
             
@@ -103,11 +205,7 @@ class OnsetDetector:
             logger.debug(f"Detected {len(onset_frames)} onset frames")
             
             # Convert frames to time in seconds
-            onset_times = librosa.frames_to_time(
-                onset_frames,
-                sr=sample_rate,
-                hop_length=self.hop_length
-            )
+            onset_times = onset_frames * (self.hop_length / sample_rate)
             
             # Filter onsets that are too close together (merge nearby onsets)
             onset_times = self._filter_close_onsets(onset_times)
@@ -125,6 +223,157 @@ class OnsetDetector:
             logger.error(f"Onset detection failed: {str(e)}")
             raise Exception(f"Onset detection error: {str(e)}")
     
+    def _get_mel_basis(self, sample_rate: int) -> np.ndarray:
+        """
+        Get the mel filterbank, rebuilding it only when parameters change.
+        
+        Args:
+            sample_rate: Sample rate in Hz
+        
+        Returns:
+            Mel filterbank matrix (n_mels x (1 + n_fft // 2))
+        """
+        key = (sample_rate, self.n_fft, self.n_mels)
+        if self._mel_basis_key != key:
+            self._mel_basis = librosa.filters.mel(
+                sr=sample_rate, n_fft=self.n_fft, n_mels=self.n_mels
+            ).astype(np.float32)
+            self._mel_basis_key = key
+        return self._mel_basis
+    
+    def _compute_log_mel(self, audio_data: np.ndarray, sample_rate: int) -> np.ndarray:
+        """
+        Compute a log-power mel spectrogram into reusable buffers.
+        
+        Equivalent to power_to_db(melspectrogram(y)), but the STFT, power
+        and mel arrays are kept on the detector and only reallocated when
+        a longer signal arrives.
+        
+        Args:
+            audio_data: Audio signal as numpy array (mono)
+            sample_rate: Sample rate in Hz
+        
+        Returns:
+            Log-power mel spectrogram (view into the internal buffer)
+        """
+        y = np.ascontiguousarray(audio_data, dtype=np.float32)
+        n_bins = 1 + self.n_fft // 2
+        n_frames = 1 + len(y) // self.hop_length
+        
+        # Grow buffers if this signal is longer than any seen before
+        if self._stft_buf is None or self._stft_buf.shape[1] < n_frames:
+            logger.debug(f"Allocating spectrogram buffers for {n_frames} frames")
+            self._stft_buf = np.empty((n_bins, n_frames), dtype=np.complex64, order='F')
+            self._power_buf = np.empty((n_bins, n_frames), dtype=np.float32)
+            self._mel_buf = np.empty((self.n_mels, n_frames), dtype=np.float32)
+        
+        # librosa uses only the leading slice of an oversized out buffer
+        with fft_backend():
+            stft = librosa.stft(
+                y, n_fft=self.n_fft, hop_length=self.hop_length,
+                dtype=np.complex64, out=self._stft_buf
+            )
+        n_frames = stft.shape[1]
+        
+        power = self._power_buf[:, :n_frames]
+        np.abs(stft, out=power)
+        np.square(power, out=power)
+        
+        mel = self._mel_buf[:, :n_frames]
+        np.matmul(self._get_mel_basis(sample_rate), power, out=mel)
+        
+        # In-place power_to_db(ref=1.0, amin=1e-10, top_db=80.0)
+        np.maximum(mel, 1e-10, out=mel)
+        np.log10(mel, out=mel)
+        mel *= 10.0
+        np.maximum(mel, mel.max() - 80.0, out=mel)
+        
+        return mel
+    
+    def detect_onsets_stream(self,
+                             filepath: str,
+                             block_length: int = 256) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Detect onsets in an audio file without loading it into memory.
+        
+        Blocks from librosa.stream overlap by n_fft - hop_length samples, so
+        each block's non-centered STFT continues the previous one exactly.
+        The last mel frame of each block is carried over so spectral flux
+        is continuous across block boundaries; peak picking runs once on the
+        full envelope. The envelope is delayed by n_fft // hop_length frames
+        so it lines up with the centered frames of detect_onsets.
+        
+        Args:
+            filepath: Path to audio file
+            block_length: Number of STFT frames per block
+        
+        Returns:
+            Tuple of (onset_times, onset_strength)
+        """
+        logger.info(f"Streaming onset detection: {filepath}")
+        
+        try:
+            sample_rate = librosa.get_samplerate(filepath)
+            mel_basis = self._get_mel_basis(sample_rate)
+            
+            stream = librosa.stream(
+                filepath,
+                block_length=block_length,
+                frame_length=self.n_fft,
+                hop_length=self.hop_length,
+                mono=True,
+                fill_value=0
+            )
+            
+            # Non-centered frame k is centered frame k + n_fft // (2 * hop_length),
+            # and the centered envelope is padded by as many frames again
+            envelopes = [np.zeros(self.n_fft // self.hop_length, dtype=np.float32)]
+            prev_frame = None
+            for block in stream:
+                with fft_backend():
+                    stft = librosa.stft(
+                        block, n_fft=self.n_fft, hop_length=self.hop_length,
+                        center=False, dtype=np.complex64
+                    )
+                power = np.abs(stft)
+                np.square(power, out=power)
+                
+                # Absolute dB scale (no per-block top_db) keeps blocks comparable
+                mel = librosa.power_to_db(mel_basis @ power, ref=1.0, top_db=None)
+                
+                if prev_frame is None:
+                    envelopes.append(_flux_envelope(mel, 1))
+                else:
+                    joined = np.concatenate([prev_frame, mel], axis=1)
+                    envelopes.append(_flux_envelope(joined, 0)[:mel.shape[1]])
+                prev_frame = mel[:, -1:]
+            
+            onset_env = np.concatenate(envelopes)
+            logger.debug(f"Onset strength envelope computed: {len(onset_env)} frames")
+            
+            onset_frames = librosa.onset.onset_detect(
+                onset_envelope=onset_env,
+                sr=sample_rate,
+                hop_length=self.hop_length,
+                backtrack=self.backtrack,
+                units='frames'
+            )
+            onset_times = self._filter_close_onsets(
+                onset_frames * (self.hop_length / sample_rate)
+            )
+            
+            logger.info(f"Onset detection complete: {len(onset_times)} onsets detected")
+            
+            self.onset_times = onset_times
+            self.onset_frames = onset_frames
+            self.onset_strength = onset_env
+            
+            return onset_times, onset_env
+            
+        except Exception as e:
+            logger.error(f"Streaming onset detection failed: {str(e)}")
+            raise Exception(f"Onset detection error: {str(e)}")
+    
     def _filter_close_onsets(self, onset_times: np.ndarray) -> np.ndarray:
         """
         Filter out onsets that are too close together.
@@ -139,20 +388,14 @@ class OnsetDetector:
         if len(onset_times) <= 1:
             return onset_times
         
-        # Keep first onset
-        filtered = [onset_times[0]]
-        
-        # Check each subsequent onset
-        for onset in onset_times[1:]:
-            # If onset is far enough from previous, keep it
-            if onset - filtered[-1] >= self.min_note_duration:
-                filtered.append(onset)
-            else:
-                logger.debug(f"Filtered onset at {onset:.3f}s (too close to previous)")
+        filtered = _greedy_filter(
+            np.ascontiguousarray(onset_times, dtype=np.float64),
+            float(self.min_note_duration)
+        )
         
         logger.debug(f"Filtered {len(onset_times) - len(filtered)} close onsets")
         
-        return np.array(filtered)
+        return filtered
     
     def get_onset_intervals(self, 
                            total_duration: float) -> List[Tuple[float, float]]:
@@ -236,15 +479,14 @@ class OnsetDetector:
         """
         # Create a timeline string
         timeline_width = 80
-        timeline = ['-'] * timeline_width
+        timeline = np.full(timeline_width, ord('-'), dtype=np.uint8)
         
-        # Mark onsets on the timeline
-        for onset in onset_times:
-            position = int((onset / duration) * (timeline_width - 1))
-            if 0 <= position < timeline_width:
-                timeline[position] = '|'
+        # Mark onsets on the timeline (out-of-range onsets are dropped)
+        positions = (np.asarray(onset_times) / duration * (timeline_width - 1)).astype(np.int64)
+        positions = positions[(positions >= 0) & (positions < timeline_width)]
+        timeline[positions] = ord('|')
         
-        timeline_str = ''.join(timeline)
+        timeline_str = timeline.tobytes().decode('ascii')
         
         # Add time markers
         time_markers = f"0s{' ' * (timeline_width - 10)}{duration:.1f}s"
@@ -288,16 +530,31 @@ class OnsetDetector:
         """
         logger.debug("Combining onsets with pitch information...")
         
-        notes = []
+        onset_times = np.asarray(onset_times, dtype=np.float64)
+        freq_times = np.asarray(freq_times)
+        frequencies = np.asarray(frequencies)
         
-        for onset in onset_times:
-            # Find the frequency closest to this onset time
-            idx = np.argmin(np.abs(freq_times - onset))
-            frequency = frequencies[idx]
-            
-            # Only include if a valid pitch was detected
-            if frequency > 0:
-                notes.append((float(onset), float(frequency), 1.0))
+        if len(onset_times) == 0 or len(freq_times) == 0:
+            logger.debug("Created 0 note segments from onsets")
+            return []
+        
+        # freq_times is monotonically increasing, so binary-search each onset
+        # and pick the nearer of its two neighbours (ties go to the earlier frame)
+        if len(freq_times) < 2:
+            final_idx = np.zeros(len(onset_times), dtype=np.intp)
+        else:
+            idx = np.clip(np.searchsorted(freq_times, onset_times), 1, len(freq_times) - 1)
+            left_closer = (onset_times - freq_times[idx - 1]) <= (freq_times[idx] - onset_times)
+            final_idx = np.where(left_closer, idx - 1, idx)
+        
+        freqs = frequencies[final_idx]
+        
+        # Only include onsets where a valid pitch was detected
+        valid = freqs > 0
+        notes = [
+            (onset, frequency, 1.0)
+            for onset, frequency in zip(onset_times[valid].tolist(), freqs[valid].tolist())
+        ]
         
         logger.debug(f"Created {len(notes)} note segments from onsets")
         
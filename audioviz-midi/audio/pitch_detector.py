@@ -5,14 +5,108 @@ Extracts pitch information from audio signals using librosa.
 Implements multiple detection algorithms for flexibility and accuracy.
 """
 
-import librosa
+import math
+import hashlib
+import lazy_loader as lazy
 import numpy as np
+from numba import njit
+from collections import OrderedDict
 from typing import Tuple, Optional
 from utils.logger import get_logger
 from utils.config import ConfigManager
+from .feature_cache import FeatureCache
+from .fft_backend import fft_backend
 
 logger = get_logger(__name__)
 
+# Imported on first use so AudioLoader can set LIBROSA_CACHE_* beforehand
+librosa = lazy.load('librosa')
+
+
+@njit(cache=True, fastmath=True)
+def _parabolic_shift(a, b, c):
+    """
+    Vertex offset of the parabola through (-1, c), (0, b), (1, a).
+    
+    Args:
+        a: Magnitude of the upper neighbour bin
+        b: Magnitude of the peak bin
+        c: Magnitude of the lower neighbour bin
+    
+    Returns:
+        Sub-bin offset of the true peak (0 for a flat neighbourhood)
+    """
+    denom = 2.0 * b - a - c
+    if abs(denom) < 1e-12:
+        return 0.0
+    return 0.5 * (a - c) / denom
+
+
+@njit(cache=True, fastmath=True)
+def _piptrack_peaks(S, bin_hz, k_lo, k_hi, rel_threshold, abs_threshold, fmin, fmax):
+    """
+    Fused piptrack: per-frame strongest interpolated spectral peak.
+    
+    Same candidate rules as librosa.piptrack (local maxima above
+    rel_threshold * frame max, bins inside [fmin, fmax)), refined by
+    parabolic interpolation, followed by the strongest-candidate pick and
+    the absolute range/threshold filter -- without materializing the
+    bins x frames pitch and magnitude matrices.
+    
+    Args:
+        S: Magnitude spectrogram (bins x frames)
+        bin_hz: Bin spacing in Hz (sr / n_fft)
+        k_lo: First bin inside the frequency range
+        k_hi: One past the last bin inside the frequency range
+        rel_threshold: Peak threshold relative to the frame maximum
+        abs_threshold: Minimum interpolated magnitude to keep a pitch
+        fmin: Minimum frequency in Hz
+        fmax: Maximum frequency in Hz
+    
+    Returns:
+        Tuple of (frequencies, confidences); 0 where no valid pitch
+    """
+    n_bins, n_frames = S.shape
+    frequencies = np.zeros(n_frames)
+    confidences = np.zeros(n_frames)
+    
+    for t in range(n_frames):
+        ref = 0.0
+        for k in range(n_bins):
+            if S[k, t] > ref:
+                ref = S[k, t]
+        thr = rel_threshold * ref
+        
+        best_mag = 0.0
+        best_freq = 0.0
+        for k in range(k_lo, k_hi):
+            x = S[k, t] if S[k, t] > thr else 0.0
+            x_prev = S[k - 1, t] if k > 0 and S[k - 1, t] > thr else 0.0
+            if k + 1 < n_bins:
+                x_next = S[k + 1, t] if S[k + 1, t] > thr else 0.0
+            else:
+                x_next = x
+            if not (x > x_prev and x >= x_next):
+                continue
+            
+            shift = 0.0
+            mag = S[k, t]
+            if 0 < k < n_bins - 1:
+                a = S[k + 1, t]
+                c = S[k - 1, t]
+                shift = _parabolic_shift(a, mag, c)
+                mag += 0.25 * (a - c) * shift
+            
+            if mag > best_mag:
+                best_mag = mag
+                best_freq = (k + shift) * bin_hz
+        
+        if fmin <= best_freq <= fmax and best_mag > abs_threshold:
+            frequencies[t] = best_freq
+            confidences[t] = best_mag
+    
+    return frequencies, confidences
+
 
 class PitchDetector:
     """
@@ -28,6 +122,20 @@ class PitchDetector:
     # Supported pitch detection algorithms
     ALGORITHMS = ['piptrack', 'pyin']
     
+    # Analysis window (STFT / pyin frame) length at the input sample rate
+    N_FFT = 2048
+    
+    # Most recent detection results kept across instances (LRU)
+    RESULT_CACHE_SIZE = 4
+    _result_cache = OrderedDict()
+    
+    # Pitch-class names, built once (tuple for scalar lookup, array for batches)
+    _NOTE_NAMES = ('C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B')
+    _NOTE_NAME_ARRAY = np.array(_NOTE_NAMES)
+    
+    # Semitones per natural-log unit of frequency ratio (12 / ln 2)
+    _LN2_INV_12 = 12.0 / math.log(2.0)
+    
     def __init__(self, config: Optional[ConfigManager] = None):
         """
         Initialize the Pitch Detector.
@@ -42,6 +150,7 @@ class PitchDetector:
         self.fmin = self.config.get('pitch_detection', 'fmin', 65.0)  # C2
         self.fmax = self.config.get('pitch_detection', 'fmax', 2093.0)  # C7
         self.threshold = self.config.get('pitch_detection', 'threshold', 0.1)
+        self.downsample = self.config.get('pitch_detection', 'downsample', True)
         
         # Validate algorithm selection
         if self.algorithm not in self.ALGORITHMS:
@@ -56,11 +165,17 @@ class PitchDetector:
         self.frequencies = None
         self.confidences = None
         self.times = None
+        self._valid_mask = None
+        self._valid_pitches = None
+        
+        # Analysis windows by length, reused across STFT calls
+        self._window_cache = {}
     
     def detect_pitch(self, 
                     audio_data: np.ndarray, 
                     sample_rate: int,
-                    hop_length: int = 512) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                    hop_length: int = 512,
+                    feature_cache: Optional[FeatureCache] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Detect pitch from audio signal.
         
@@ -68,6 +183,8 @@ class PitchDetector:
             audio_data: Audio signal as numpy array (mono)
             sample_rate: Sample rate in Hz (typically 22050)
             hop_length: Number of samples between analysis frames (default: 512)
+            feature_cache: Optional shared FeatureCache; piptrack reuses its
+                magnitude spectrogram when the hop length matches
         
         Returns:
             Tuple of (frequencies, confidences, times)
@@ -80,30 +197,58 @@ class PitchDetector:
         logger.debug(f"Hop length: {hop_length} samples")
         
         try:
-            if self.algorithm == 'piptrack':
-                frequencies, confidences, times = self._detect_piptrack(
-                    audio_data, sample_rate, hop_length
-                )
-            elif self.algorithm == 'pyin':
-                frequencies, confidences, times = self._detect_pyin(
-                    audio_data, sample_rate, hop_length
-                )
+            # A shared spectrogram makes piptrack's STFT free, which beats
+            # decimating and recomputing it at the lower rate
+            use_cache = (
+                self.algorithm == 'piptrack'
+                and feature_cache is not None
+                and feature_cache.matches(hop_length, self.N_FFT)
+            )
+            factor = 1
+            if self.downsample and not use_cache:
+                factor = self._decimation_factor(sample_rate, hop_length, self.N_FFT)
+            
+            # Identical requests (e.g. re-running the same file) reuse results
+            cache_key = self._cache_key(
+                audio_data, sample_rate, hop_length, use_cache, self.N_FFT // factor
+            )
+            result = self._result_cache.get(cache_key)
+            if result is not None:
+                self._result_cache.move_to_end(cache_key)
+                logger.debug("Pitch detection result served from cache")
             else:
-                raise ValueError(f"Unsupported algorithm: {self.algorithm}")
+                # Route librosa's FFTs through the fastest installed library
+                with fft_backend():
+                    result = self._run_detection(
+                        audio_data, sample_rate, hop_length,
+                        feature_cache if use_cache else None, factor
+                    )
+                
+                # Cached arrays are shared by every caller, so make them read-only
+                for values in result:
+                    values.flags.writeable = False
+                self._result_cache[cache_key] = result
+                if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+            
+            frequencies, confidences, times = result
             
             # Store results
             self.frequencies = frequencies
             self.confidences = confidences
             self.times = times
             
+            # Voiced-frame mask computed once and shared with get_detection_stats
+            self._valid_mask = frequencies > 0
+            self._valid_pitches = valid_pitches = frequencies[self._valid_mask]
+            
             # Log statistics
-            valid_pitches = frequencies[frequencies > 0]
             logger.info(f"Pitch detection complete")
             logger.debug(f"Total frames analyzed: {len(frequencies)}")
             logger.debug(f"Frames with pitch detected: {len(valid_pitches)}")
             if len(valid_pitches) > 0:
                 logger.debug(f"Frequency range: {valid_pitches.min():.2f} - {valid_pitches.max():.2f} Hz")
-                logger.debug(f"Average confidence: {confidences[frequencies > 0].mean():.3f}")
+                logger.debug(f"Average confidence: {confidences[self._valid_mask].mean():.3f}")
             
             return frequencies, confidences, times
             
@@ -111,72 +256,203 @@ class PitchDetector:
             logger.error(f"Pitch detection failed: {str(e)}")
             raise Exception(f"Pitch detection error: {str(e)}")
     
+    def _run_detection(self,
+                       audio_data: np.ndarray,
+                       sample_rate: int,
+                       hop_length: int,
+                       feature_cache: Optional[FeatureCache],
+                       factor: int = 1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Run the configured pitch detection algorithm.
+        
+        Args:
+            audio_data: Audio signal as numpy array (mono)
+            sample_rate: Sample rate in Hz
+            hop_length: Number of samples between analysis frames
+            feature_cache: Shared FeatureCache whose spectrogram piptrack
+                reuses, or None to compute it
+            factor: Decimation factor from _decimation_factor (1 = none)
+        
+        Returns:
+            Tuple of (frequencies, confidences, times)
+        """
+        n_fft = self.N_FFT
+        
+        if factor > 1:
+            audio_data, sample_rate, hop_length, n_fft = self._downsample(
+                audio_data, sample_rate, hop_length, n_fft, factor
+            )
+        
+        if self.algorithm == 'piptrack':
+            S = feature_cache.magnitude if feature_cache is not None else None
+            frequencies, confidences, times = self._detect_piptrack(
+                audio_data, sample_rate, hop_length, S=S, n_fft=n_fft
+            )
+        elif self.algorithm == 'pyin':
+            frequencies, confidences, times = self._detect_pyin(
+                audio_data, sample_rate, hop_length, frame_length=n_fft
+            )
+        else:
+            raise ValueError(f"Unsupported algorithm: {self.algorithm}")
+        
+        return frequencies, confidences, times
+    
+    def _cache_key(self,
+                   audio_data: np.ndarray,
+                   sample_rate: int,
+                   hop_length: int,
+                   use_cache: bool,
+                   n_fft: int) -> tuple:
+        """
+        Build the result-cache key for a detection request.
+        
+        Args:
+            audio_data: Audio signal
+            sample_rate: Sample rate in Hz
+            hop_length: Hop length in samples
+            use_cache: Whether piptrack reuses a shared FeatureCache spectrogram
+            n_fft: Effective analysis window length (after decimation)
+        
+        Returns:
+            Hashable key covering the audio content and all settings
+        """
+        digest = hashlib.blake2b(
+            np.ascontiguousarray(audio_data).view(np.uint8), digest_size=16
+        ).digest()
+        return (
+            digest, audio_data.dtype.str, sample_rate, hop_length, use_cache, n_fft,
+            self.algorithm, self.fmin, self.fmax, self.threshold
+        )
+    
+    def _decimation_factor(self, sample_rate: int, hop_length: int, n_fft: int) -> int:
+        """
+        Find the largest decimation factor that still covers fmax.
+        
+        Only integer factors that divide the sample rate, the hop length
+        and the window length are used, so frame times and the analysis
+        window duration (and hence frequency resolution) stay identical to
+        the original rate and frames line up with onset frames.
+        
+        Args:
+            sample_rate: Sample rate in Hz
+            hop_length: Hop length in samples
+            n_fft: Analysis window length in samples
+        
+        Returns:
+            Decimation factor (1 if no useful factor exists)
+        """
+        min_rate = max(2.5 * self.fmax, 8000)
+        factor = int(sample_rate // min_rate)
+        while factor > 1 and (sample_rate % factor or hop_length % factor or n_fft % factor):
+            factor -= 1
+        
+        return max(factor, 1)
+    
+    def _downsample(self,
+                    audio_data: np.ndarray,
+                    sample_rate: int,
+                    hop_length: int,
+                    n_fft: int,
+                    factor: int) -> Tuple[np.ndarray, int, int, int]:
+        """
+        Decimate audio by an integer factor from _decimation_factor.
+        
+        Args:
+            audio_data: Audio signal
+            sample_rate: Sample rate in Hz
+            hop_length: Hop length in samples
+            n_fft: Analysis window length in samples
+            factor: Decimation factor (divides all of the above)
+        
+        Returns:
+            Tuple of (audio_data, sample_rate, hop_length, n_fft) at the
+            reduced rate
+        """
+        target_sr = sample_rate // factor
+        logger.debug(f"Downsampling {sample_rate} Hz -> {target_sr} Hz for pitch detection")
+        
+        audio_data = librosa.resample(
+            audio_data, orig_sr=sample_rate, target_sr=target_sr, res_type='polyphase'
+        )
+        
+        return audio_data, target_sr, hop_length // factor, n_fft // factor
+    
     def _detect_piptrack(self, 
                         audio_data: np.ndarray, 
                         sample_rate: int,
-                        hop_length: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                        hop_length: int,
+                        S: Optional[np.ndarray] = None,
+                        n_fft: int = 2048) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Detect pitch using librosa's piptrack algorithm.
+        Detect pitch using the piptrack algorithm.
         Fast method suitable for real-time processing.
         
         Args:
             audio_data: Audio signal
             sample_rate: Sample rate in Hz
             hop_length: Hop length in samples
+            S: Optional precomputed magnitude spectrogram (computed with n_fft)
+            n_fft: FFT window size
         
         Returns:
             Tuple of (frequencies, confidences, times)
         """
         logger.debug("Using piptrack algorithm for pitch detection")
         
-        # Compute pitch using piptrack
-        pitches, magnitudes = librosa.piptrack(
-            y=audio_data,
-            sr=sample_rate,
-            hop_length=hop_length,
-            fmin=self.fmin,
-            fmax=self.fmax,
-            threshold=self.threshold
+        if S is None:
+            S = np.abs(librosa.stft(
+                audio_data, n_fft=n_fft, hop_length=hop_length,
+                window=self._get_window(n_fft)
+            ))
+        
+        # Bins inside [fmin, fmax), as in librosa.piptrack
+        bin_hz = sample_rate / n_fft
+        k_lo = int(np.ceil(self.fmin / bin_hz))
+        k_hi = min(int(np.ceil(self.fmax / bin_hz)), S.shape[0])
+        
+        # Peak picking, parabolic refinement and per-frame selection in one pass
+        num_frames = S.shape[1]
+        frequencies, confidences = _piptrack_peaks(
+            S, bin_hz, k_lo, k_hi, self.threshold, self.threshold, self.fmin, self.fmax
         )
         
-        # Extract the most prominent pitch for each time frame
-        num_frames = pitches.shape[1]
-        frequencies = np.zeros(num_frames)
-        confidences = np.zeros(num_frames)
-        
-        for t in range(num_frames):
-            # Get the index of the maximum magnitude at this time frame
-            index = magnitudes[:, t].argmax()
-            
-            # Extract frequency and magnitude
-            freq = pitches[index, t]
-            mag = magnitudes[index, t]
-            
-            # Only keep frequencies within our range and above threshold
-            if self.fmin <= freq <= self.fmax and mag > self.threshold:
-                frequencies[t] = freq
-                confidences[t] = mag
-            else:
-                frequencies[t] = 0.0
-                confidences[t] = 0.0
-        
         # Normalize confidences to [0, 1] range
         if confidences.max() > 0:
             confidences = confidences / confidences.max()
         
         # Calculate time stamps for each frame
-        times = librosa.frames_to_time(
-            np.arange(num_frames),
-            sr=sample_rate,
-            hop_length=hop_length
+        times = np.arange(num_frames, dtype=np.float64) * (hop_length / float(sample_rate))
+        
+        # float32 is ample for Hz and confidences; frame times stay float64
+        # because the converter compares them against float64 onset times
+        return (
+            frequencies.astype(np.float32, copy=False),
+            confidences.astype(np.float32, copy=False),
+            times
         )
+    
+    def _get_window(self, n_fft: int) -> np.ndarray:
+        """
+        Get a periodic Hann window of the given length, built once.
         
-        return frequencies, confidences, times
+        Args:
+            n_fft: Window length in samples
+        
+        Returns:
+            Hann window (same as librosa's default 'hann')
+        """
+        window = self._window_cache.get(n_fft)
+        if window is None:
+            from scipy.signal import get_window
+            window = get_window('hann', n_fft, fftbins=True)
+            self._window_cache[n_fft] = window
+        return window
     
     def _detect_pyin(self, 
                     audio_data: np.ndarray, 
                     sample_rate: int,
-                    hop_length: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                    hop_length: int,
+                    frame_length: int = 2048) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Detect pitch using librosa's pyin algorithm.
         More accurate method better for offline analysis.
@@ -185,6 +461,7 @@ class PitchDetector:
             audio_data: Audio signal
             sample_rate: Sample rate in Hz
             hop_length: Hop length in samples
+            frame_length: Analysis frame length in samples
         
         Returns:
             Tuple of (frequencies, confidences, times)
@@ -195,25 +472,28 @@ class PitchDetector:
         f0, voiced_flag, voiced_probs = librosa.pyin(
             y=audio_data,
             sr=sample_rate,
+            frame_length=frame_length,
             hop_length=hop_length,
             fmin=self.fmin,
             fmax=self.fmax
         )
         
-        # Replace NaN values with 0
-        frequencies = np.nan_to_num(f0, nan=0.0)
+        # Replace NaN values with 0 (in place; pyin returns a fresh array)
+        frequencies = np.nan_to_num(f0, copy=False, nan=0.0)
         
-        # Use voiced probabilities as confidence scores
-        confidences = voiced_probs
+        # Use voiced probabilities as confidence scores (no copy if already contiguous)
+        confidences = np.ascontiguousarray(voiced_probs)
         
         # Calculate time stamps for each frame
-        times = librosa.frames_to_time(
-            np.arange(len(frequencies)),
-            sr=sample_rate,
-            hop_length=hop_length
+        times = np.arange(len(frequencies), dtype=np.float64) * (hop_length / float(sample_rate))
+        
+        # float32 is ample for Hz and confidences; frame times stay float64
+        # because the converter compares them against float64 onset times
+        return (
+            frequencies.astype(np.float32, copy=False),
+            confidences.astype(np.float32, copy=False),
+            times
         )
-        
-        return frequencies, confidences, times
     
     def get_detection_stats(self) -> dict:
         """
@@ -226,7 +506,7 @@ class PitchDetector:
             logger.warning("No pitch detection has been performed yet")
             return {}
         
-        valid_pitches = self.frequencies[self.frequencies > 0]
+        valid_pitches = self._valid_pitches
         
         stats = {
             'algorithm': self.algorithm,
@@ -234,7 +514,7 @@ class PitchDetector:
             'frames_with_pitch': len(valid_pitches),
             'pitch_coverage': len(valid_pitches) / len(self.frequencies) if len(self.frequencies) > 0 else 0,
             'frequency_range': (float(valid_pitches.min()), float(valid_pitches.max())) if len(valid_pitches) > 0 else (0, 0),
-            'average_confidence': float(self.confidences[self.frequencies > 0].mean()) if len(valid_pitches) > 0 else 0,
+            'average_confidence': float(self.confidences[self._valid_mask].mean()) if len(valid_pitches) > 0 else 0,
             'duration': float(self.times[-1]) if len(self.times) > 0 else 0
         }
         
@@ -291,15 +571,36 @@ class PitchDetector:
         if frequency <= 0:
             return 'N/A'
         
-        # Note names
-        note_names = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        
-        # Convert frequency to MIDI note number
-        midi_note = 69 + 12 * np.log2(frequency / 440.0)
-        midi_note_rounded = int(round(midi_note))
+        # Convert frequency to MIDI note number (math.log avoids NumPy scalar dispatch)
+        midi_note = round(69 + math.log(frequency / 440.0) * PitchDetector._LN2_INV_12)
         
         # Get note name and octave
-        note_index = midi_note_rounded % 12
-        octave = (midi_note_rounded // 12) - 1
+        return f"{PitchDetector._NOTE_NAMES[midi_note % 12]}{midi_note // 12 - 1}"
+    
+    @staticmethod
+    def frequencies_to_note_names(frequencies: np.ndarray) -> np.ndarray:
+        """
+        Convert an array of frequencies to musical note names.
+        
+        Batched equivalent of frequency_to_note_name: one log2 and one
+        rounding over the whole array instead of per-value NumPy calls.
+        
+        Args:
+            frequencies: Array of frequencies in Hz
+        
+        Returns:
+            Object array of note names ('N/A' where frequency is 0)
+        """
+        frequencies = np.asarray(frequencies, dtype=np.float64)
+        voiced = frequencies > 0
+        
+        # Substitute A4 for unvoiced frames so log2 stays finite
+        safe = np.where(voiced, frequencies, 440.0)
+        midi_notes = np.rint(69 + 12 * np.log2(safe / 440.0)).astype(np.int64)
+        
+        names = np.char.add(
+            PitchDetector._NOTE_NAME_ARRAY[midi_notes % 12],
+            (midi_notes // 12 - 1).astype(str)
+        )
         
-        return f"{note_names[note_index]}{octave}"
+        return np.where(voiced, names, 'N/A').astype(object)
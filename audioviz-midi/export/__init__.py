@@ -6,5 +6,6 @@ Handles exporting MIDI data to various file formats.
 
 from .midi_exporter import MIDIExporter
 from .json_exporter import JSONExporter
+from .batch_exporter import export_all
 
-__all__ = ['MIDIExporter', 'JSONExporter']
+__all__ = ['MIDIExporter', 'JSONExporter', 'export_all']
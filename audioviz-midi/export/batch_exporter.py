@@ -0,0 +1,49 @@
+# export/batch_exporter.py
+"""
+Batch Exporter Module for AudioViz MIDI.
+Writes the MIDI and JSON exports of one transcription concurrently.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from midi import MIDIData
+from utils.logger import get_logger
+from .midi_exporter import MIDIExporter
+from .json_exporter import JSONExporter
+
+logger = get_logger(__name__)
+
+
+def export_all(midi_data: MIDIData,
+               midi_path: str,
+               json_path: str,
+               source_file: Optional[str] = None,
+               midi_exporter: Optional[MIDIExporter] = None,
+               json_exporter: Optional[JSONExporter] = None) -> tuple[bool, bool]:
+    """
+    Export MIDI data to a .mid and a .json file at the same time.
+    
+    The two exports are independent I/O jobs, so they run on separate
+    threads and the second file no longer waits for the first to be written.
+    
+    Args:
+        midi_data: MIDIData object containing notes
+        midi_path: Output MIDI file path (.mid)
+        json_path: Output JSON file path (.json)
+        source_file: Optional source audio filename for JSON metadata
+        midi_exporter: MIDI exporter to use (default: new instance)
+        json_exporter: JSON exporter to use (default: new instance)
+    
+    Returns:
+        Tuple of (midi_success, json_success)
+    """
+    midi_exporter = midi_exporter or MIDIExporter()
+    json_exporter = json_exporter or JSONExporter()
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        midi_future = executor.submit(midi_exporter.export, midi_data, midi_path)
+        json_future = executor.submit(json_exporter.export, midi_data, json_path, source_file)
+        results = (midi_future.result(), json_future.result())
+    
+    logger.info(f"Batch export finished (midi={results[0]}, json={results[1]})")
+    return results
@@ -6,14 +6,44 @@ Exports MIDI data to JSON format with detailed note information.
 
 import json
 import os
+import numpy as np
 from typing import Optional
 from midi import MIDIData
 from utils.logger import get_logger
 from utils.config import ConfigManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
 
+def _json_default(obj):
+    """Serialize numpy scalars that orjson does not handle natively."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(value) -> bytes:
+    """
+    Serialize a value to compact single-line JSON bytes.
+    
+    Args:
+        value: JSON-serializable value
+    
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(
+        value, ensure_ascii=False, separators=(',', ':'), default=_json_default
+    ).encode('utf-8')
+
+
 class JSONExporter:
     """
     Exports MIDI data to JSON format.
@@ -56,49 +86,51 @@ class JSONExporter:
                 logger.error("No MIDI data to export")
                 return False
             
-            # Build JSON structure
-            data = {
+            # Note dicts and statistics come from a single walk over the notes
+            notes, stats = midi_data.notes_and_stats()
+            
+            # Header fields, then notes streamed one per line so the output
+            # is never built as one big string
+            header = {
                 "format": "AudioViz MIDI JSON Export",
                 "version": "1.0"
             }
             
             # Add metadata if enabled
             if self.include_metadata:
-                data["metadata"] = self._build_metadata(midi_data, source_file)
+                header["metadata"] = self._build_metadata(stats, source_file)
             
-            # Add notes
-            data["notes"] = midi_data.to_dict_list()
+            with open(output_path, 'wb') as f:
+                f.write(b'{\n')
+                for key, value in header.items():
+                    f.write(b'  ' + _dumps(key) + b': ' + _dumps(value) + b',\n')
+                
+                f.write(b'  "notes": [\n')
+                for i, note in enumerate(notes):
+                    if i:
+                        f.write(b',\n')
+                    f.write(b'    ' + _dumps(note))
+                f.write(b'\n  ]\n}\n')
+                file_size = f.tell()
             
-            # Write JSON file with pretty formatting
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            # Verify file was created
-            if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path)
-                logger.info(f"JSON file exported successfully: {file_size} bytes")
-                return True
-            else:
-                logger.error("JSON file was not created")
-                return False
+            logger.info(f"JSON file exported successfully: {file_size} bytes")
+            return True
             
         except Exception as e:
             logger.error(f"Failed to export JSON: {e}", exc_info=True)
             return False
     
-    def _build_metadata(self, midi_data: MIDIData, source_file: Optional[str]) -> dict:
+    def _build_metadata(self, stats: dict, source_file: Optional[str]) -> dict:
         """
         Build metadata dictionary.
         
         Args:
-            midi_data: Source MIDI data
+            stats: Statistics of the source MIDI data
             source_file: Source audio filename
         
         Returns:
             Metadata dictionary
         """
-        stats = midi_data.get_statistics()
-        
         metadata = {
             "total_notes": stats['total_notes'],
             "duration_seconds": round(stats['duration'], 3),
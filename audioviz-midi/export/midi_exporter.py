@@ -22,6 +22,19 @@ class MIDIExporter:
     Includes proper timing, velocity, and instrument assignment.
     """
     
+    # Common instrument mappings (General MIDI)
+    _INSTRUMENT_PROGRAMS = {
+        "Acoustic Grand Piano": 0,
+        "Electric Piano": 4,
+        "Guitar": 24,
+        "Acoustic Guitar": 24,
+        "Electric Guitar": 27,
+        "Bass": 32,
+        "Strings": 48,
+        "Violin": 40,
+        "Cello": 42,
+    }
+    
     def __init__(self, config: Optional[ConfigManager] = None):
         """
         Initialize the MIDI exporter.
@@ -64,16 +77,17 @@ class MIDIExporter:
             instrument_program = self._get_instrument_program(instrument_name)
             instrument = pretty_midi.Instrument(program=instrument_program)
             
-            # Add notes to instrument
-            for note in midi_data.get_notes():
-                # Create pretty_midi Note
-                pm_note = pretty_midi.Note(
+            # Add notes to instrument (one comprehension, no per-note append)
+            PMNote = pretty_midi.Note
+            instrument.notes[:] = [
+                PMNote(
                     velocity=note.velocity,
                     pitch=note.pitch,
                     start=note.start_time,
                     end=note.end_time
                 )
-                instrument.notes.append(pm_note)
+                for note in midi_data.get_notes()
+            ]
             
             # Add instrument to MIDI object
             midi.instruments.append(instrument)
@@ -82,17 +96,13 @@ class MIDIExporter:
             if self.include_metadata:
                 self._add_metadata(midi, midi_data)
             
-            # Write MIDI file
-            midi.write(output_path)
+            # Write MIDI file; the handle's position gives the size without a re-stat
+            with open(output_path, 'wb') as f:
+                midi.write(f)
+                file_size = f.tell()
             
-            # Verify file was created
-            if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path)
-                logger.info(f"MIDI file exported successfully: {file_size} bytes")
-                return True
-            else:
-                logger.error("MIDI file was not created")
-                return False
+            logger.info(f"MIDI file exported successfully: {file_size} bytes")
+            return True
             
         except Exception as e:
             logger.error(f"Failed to export MIDI: {e}", exc_info=True)
@@ -108,20 +118,7 @@ class MIDIExporter:
         Returns:
             MIDI program number (0-127)
         """
-        # Common instrument mappings (General MIDI)
-        instruments = {
-            "Acoustic Grand Piano": 0,
-            "Electric Piano": 4,
-            "Guitar": 24,
-            "Acoustic Guitar": 24,
-            "Electric Guitar": 27,
-            "Bass": 32,
-            "Strings": 48,
-            "Violin": 40,
-            "Cello": 42,
-        }
-        
-        return instruments.get(instrument_name, 0)  # Default to piano
+        return self._INSTRUMENT_PROGRAMS.get(instrument_name, 0)  # Default to piano
     
     def _add_metadata(self, midi: pretty_midi.PrettyMIDI, midi_data: MIDIData):
         """
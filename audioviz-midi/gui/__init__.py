@@ -6,7 +6,8 @@ Handles all user interface components and interactions.
 
 from .main_window import MainWindow
 from .file_drop_widget import FileDropWidget
-from .processing_thread import ProcessingThread
+from .processing_thread import ProcessingThread, ProcessingWorker
 from .control_panel import ControlPanel
+from .styles import load_stylesheet
 
-__all__ = ['MainWindow', 'FileDropWidget', 'ProcessingThread', 'ControlPanel']
+__all__ = ['MainWindow', 'FileDropWidget', 'ProcessingThread', 'ProcessingWorker', 'ControlPanel', 'load_stylesheet']
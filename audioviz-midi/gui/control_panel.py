@@ -4,6 +4,8 @@ Control Panel Widget for AudioViz MIDI.
 Provides playback controls including play, pause, stop, timeline slider, and speed control.
 """
 
+import logging
+from time import monotonic_ns
 from PyQt5.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QPushButton, 
     QSlider, QLabel, QComboBox, QSpacerItem, QSizePolicy
@@ -14,6 +16,17 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Every MM:SS string below one hour, indexed by whole seconds
+_MMSS_TABLE = tuple(f'{m:02d}:{s:02d}' for m in range(60) for s in range(60))
+
+
+def _set_enabled(widget: QWidget, enabled: bool):
+    """Enable or disable a widget, skipping Qt work if the state is unchanged."""
+    # WA_ForceDisabled reflects the widget's own flag, unlike isEnabled(),
+    # which is also False while an ancestor is disabled
+    if widget.testAttribute(Qt.WA_ForceDisabled) == enabled:
+        widget.setEnabled(enabled)
+
 
 class ControlPanel(QWidget):
     """
@@ -34,6 +47,10 @@ class ControlPanel(QWidget):
     seek_requested = pyqtSignal(float)  # Position from 0.0 to 1.0
     speed_changed = pyqtSignal(float)  # Speed multiplier
     
+    # Playback speeds offered in the speed combo box, and the default (1.0x)
+    SPEEDS = (0.5, 0.75, 1.0, 1.25, 1.5, 2.0)
+    DEFAULT_SPEED_INDEX = 2
+    
     def __init__(self, parent=None):
         """
         Initialize the control panel.
@@ -43,17 +60,49 @@ class ControlPanel(QWidget):
         """
         super().__init__(parent)
         
+        # Styled by the #control_panel rules of the application stylesheet
+        self.setObjectName('control_panel')
+        
         # State
         self.is_playing = False
         self.total_duration = 0.0
+        self._duration_ms = 0  # Timeline slider range; slider value == time in ms
         self.current_time = 0.0
         self.is_enabled = False
         
-        # Setup UI
+        # Last text set on the time label
+        self._last_time_str = '00:00'
+        
+        # Throttles playback position updates to ~30/sec; the trailing timer
+        # makes sure the most recent position is always shown
+        self._last_pos_update_ns = 0
+        self._pending_pos = 0.0
+        self._pos_update_timer = QTimer(self)
+        self._pos_update_timer.setSingleShot(True)
+        self._pos_update_timer.setInterval(33)
+        self._pos_update_timer.timeout.connect(self._flush_playback_position)
+        
+        # Coalesces slider drag events into at most one label update per interval
+        self._pending_slider_value = 0
+        self._label_update_timer = QTimer(self)
+        self._label_update_timer.setSingleShot(True)
+        self._label_update_timer.setInterval(30)
+        self._label_update_timer.timeout.connect(self._flush_time_label)
+        
+        # Rate-limits live seeking while dragging to ~30 seek requests/sec
+        self._seek_pending = False
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(33)
+        self._seek_timer.timeout.connect(self._emit_live_seek)
+        
+        # Setup UI, batching the resulting layout and paint events into one
+        self.setUpdatesEnabled(False)
         self._setup_ui()
         
         # Initially disabled until transcription complete
         self.set_enabled(False)
+        self.setUpdatesEnabled(True)
         
         logger.debug("ControlPanel initialized")
     
@@ -76,9 +125,9 @@ class ControlPanel(QWidget):
         # Timeline slider
         self.timeline_slider = QSlider(Qt.Horizontal)
         self.timeline_slider.setMinimum(0)
-        self.timeline_slider.setMaximum(1000)  # Use 1000 steps for smooth seeking
+        self.timeline_slider.setMaximum(1000)  # Set to the duration in ms by set_duration
         self.timeline_slider.setValue(0)
-        self.timeline_slider.setEnabled(False)
+        _set_enabled(self.timeline_slider, False)
         self.timeline_slider.sliderPressed.connect(self._on_slider_pressed)
         self.timeline_slider.sliderReleased.connect(self._on_slider_released)
         self.timeline_slider.sliderMoved.connect(self._on_slider_moved)
@@ -107,7 +156,7 @@ class ControlPanel(QWidget):
         self.pause_button = QPushButton('⏸ Pause')
         self.pause_button.setMinimumWidth(80)
         self.pause_button.setMinimumHeight(35)
-        self.pause_button.setEnabled(False)
+        _set_enabled(self.pause_button, False)
         self.pause_button.clicked.connect(self._on_pause_clicked)
         controls_layout.addWidget(self.pause_button)
         
@@ -115,7 +164,7 @@ class ControlPanel(QWidget):
         self.stop_button = QPushButton('⏹ Stop')
         self.stop_button.setMinimumWidth(80)
         self.stop_button.setMinimumHeight(35)
-        self.stop_button.setEnabled(False)
+        _set_enabled(self.stop_button, False)
         self.stop_button.clicked.connect(self._on_stop_clicked)
         controls_layout.addWidget(self.stop_button)
         
@@ -128,98 +177,17 @@ class ControlPanel(QWidget):
         speed_label = QLabel('Speed:')
         controls_layout.addWidget(speed_label)
         
+        # Populate silently so no speed_changed is emitted during construction
         self.speed_combo = QComboBox()
-        self.speed_combo.addItems(['0.5x', '0.75x', '1.0x', '1.25x', '1.5x', '2.0x'])
-        self.speed_combo.setCurrentText('1.0x')
+        self.speed_combo.blockSignals(True)
+        self.speed_combo.addItems([f'{speed}x' for speed in self.SPEEDS])
+        self.speed_combo.setCurrentIndex(self.DEFAULT_SPEED_INDEX)
+        self.speed_combo.blockSignals(False)
         self.speed_combo.setMinimumWidth(80)
-        self.speed_combo.currentTextChanged.connect(self._on_speed_changed)
+        self.speed_combo.currentIndexChanged.connect(self._on_speed_changed)
         controls_layout.addWidget(self.speed_combo)
         
         main_layout.addLayout(controls_layout)
-        
-        # Apply styling
-        self._apply_style()
-    
-    def _apply_style(self):
-        """Apply custom styling to control panel."""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #252530;
-                border-radius: 4px;
-            }
-            QPushButton {
-                background-color: #3a3a44;
-                color: #e0e0e0;
-                border: 1px solid #4a4a54;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #4a4a54;
-                border: 1px solid #5a5a64;
-            }
-            QPushButton:pressed {
-                background-color: #2a2a34;
-            }
-            QPushButton:disabled {
-                background-color: #2a2a34;
-                color: #666;
-                border: 1px solid #3a3a44;
-            }
-            QPushButton#play_active {
-                background-color: #4a9eff;
-                border: 1px solid #5aaaff;
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid #3a3a44;
-                height: 8px;
-                background: #1e1e28;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #4a9eff;
-                border: 1px solid #5aaaff;
-                width: 16px;
-                height: 16px;
-                margin: -5px 0;
-                border-radius: 8px;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #5aaaff;
-            }
-            QSlider::sub-page:horizontal {
-                background: #4a9eff;
-                border: 1px solid #3a3a44;
-                height: 8px;
-                border-radius: 4px;
-            }
-            QComboBox {
-                background-color: #3a3a44;
-                color: #e0e0e0;
-                border: 1px solid #4a4a54;
-                border-radius: 4px;
-                padding: 5px;
-            }
-            QComboBox:hover {
-                border: 1px solid #5a5a64;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 6px solid #e0e0e0;
-                margin-right: 5px;
-            }
-            QLabel {
-                color: #e0e0e0;
-                font-size: 12px;
-            }
-        """)
     
     # Event Handlers
     
@@ -244,9 +212,14 @@ class ControlPanel(QWidget):
     
     def _on_slider_released(self):
         """Handle timeline slider release."""
+        # Final flush: drop any pending live seek in favour of the release position
+        self._seek_timer.stop()
+        self._seek_pending = False
+        
         # Emit seek request with normalized position (0.0 to 1.0)
-        position = self.timeline_slider.value() / 1000.0
-        logger.info(f"Seek requested to position: {position:.3f}")
+        position = self._slider_position()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Seek requested to position: %.3f", position)
         self.seek_requested.emit(position)
     
     def _on_slider_moved(self, value):
@@ -254,22 +227,49 @@ class ControlPanel(QWidget):
         Handle timeline slider movement.
         
         Args:
-            value: Slider value (0-1000)
+            value: Slider value (time in milliseconds)
+        """
+        # Update time label while dragging, at most once per timer interval
+        self._pending_slider_value = value
+        if not self._label_update_timer.isActive():
+            self._label_update_timer.start()
+        
+        # Live seek, rate-limited by the seek timer
+        self._seek_pending = True
+        if not self._seek_timer.isActive():
+            self._seek_timer.start()
+    
+    def _emit_live_seek(self):
+        """Emit a seek request for the latest slider drag position."""
+        if not self._seek_pending:
+            return
+        
+        self._seek_pending = False
+        self.seek_requested.emit(self._slider_position())
+    
+    def _flush_time_label(self):
+        """Update the time label from the latest slider drag position."""
+        self._update_time_label(self._format_time_ms(self._pending_slider_value))
+    
+    def _slider_position(self) -> float:
+        """
+        Get the timeline slider position.
+        
+        Returns:
+            Position from 0.0 to 1.0
         """
-        # Update time label while dragging
-        position = value / 1000.0
-        time_seconds = position * self.total_duration
-        self._update_time_label(time_seconds)
+        if self._duration_ms <= 0:
+            return 0.0
+        return self.timeline_slider.value() / self._duration_ms
     
-    def _on_speed_changed(self, text):
+    def _on_speed_changed(self, index: int):
         """
         Handle speed selection change.
         
         Args:
-            text: Selected speed text (e.g., "1.0x")
+            index: Selected index in the speed combo box
         """
-        # Extract numeric value
-        speed = float(text.replace('x', ''))
+        speed = self.SPEEDS[index]
         logger.info(f"Playback speed changed to {speed}x")
         self.speed_changed.emit(speed)
     
@@ -284,14 +284,14 @@ class ControlPanel(QWidget):
         """
         self.is_enabled = enabled
         
-        self.play_button.setEnabled(enabled)
-        self.timeline_slider.setEnabled(enabled)
-        self.speed_combo.setEnabled(enabled)
+        _set_enabled(self.play_button, enabled)
+        _set_enabled(self.timeline_slider, enabled)
+        _set_enabled(self.speed_combo, enabled)
         
         # Pause and Stop start disabled even when panel is enabled
         if not enabled:
-            self.pause_button.setEnabled(False)
-            self.stop_button.setEnabled(False)
+            _set_enabled(self.pause_button, False)
+            _set_enabled(self.stop_button, False)
         
         logger.debug(f"Control panel {'enabled' if enabled else 'disabled'}")
     
@@ -303,8 +303,14 @@ class ControlPanel(QWidget):
             duration: Total duration in seconds
         """
         self.total_duration = duration
-        self.duration_label.setText(self._format_time(duration))
-        logger.debug(f"Duration set to {duration:.2f}s")
+        self._duration_ms = int(duration * 1000)
+        if self._duration_ms > 0:
+            self.timeline_slider.setMaximum(self._duration_ms)
+        duration_str = self._format_time(duration)
+        if duration_str != self.duration_label.text():
+            self.duration_label.setText(duration_str)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Duration set to %.2fs", duration)
     
     def set_playback_position(self, time: float):
         """
@@ -314,17 +320,39 @@ class ControlPanel(QWidget):
             time: Current time in seconds
         """
         self.current_time = time
+        self._pending_pos = time
+        
+        # Drop updates arriving faster than ~30/sec; the trailing timer
+        # applies the last one
+        if monotonic_ns() - self._last_pos_update_ns < 33_000_000:
+            if not self._pos_update_timer.isActive():
+                self._pos_update_timer.start()
+            return
+        
+        self._apply_playback_position(time)
+    
+    def _flush_playback_position(self):
+        """Apply the most recent throttled playback position."""
+        self._apply_playback_position(self._pending_pos)
+    
+    def _apply_playback_position(self, time: float):
+        """
+        Update the time label and slider for a playback position.
+        
+        Args:
+            time: Current time in seconds
+        """
+        self._last_pos_update_ns = monotonic_ns()
+        
+        time_ms = int(time * 1000)
         
         # Update time label
-        self._update_time_label(time)
-        
-        # Update slider position (but don't trigger signals)
-        if self.total_duration > 0:
-            position = time / self.total_duration
-            slider_value = int(position * 1000)
-            self.timeline_slider.blockSignals(True)
-            self.timeline_slider.setValue(slider_value)
-            self.timeline_slider.blockSignals(False)
+        self._update_time_label(self._format_time_ms(time_ms))
+        
+        # Update slider position. setValue only emits valueChanged, which is
+        # not connected, so no signal blocking is needed.
+        if self._duration_ms > 0 and time_ms != self.timeline_slider.value():
+            self.timeline_slider.setValue(time_ms)
     
     def set_playing(self, playing: bool):
         """
@@ -337,38 +365,53 @@ class ControlPanel(QWidget):
         
         if playing:
             # Playing state
-            self.play_button.setEnabled(False)
-            self.pause_button.setEnabled(True)
-            self.stop_button.setEnabled(True)
+            _set_enabled(self.play_button, False)
+            _set_enabled(self.pause_button, True)
+            _set_enabled(self.stop_button, True)
             logger.debug("Playback state: Playing")
         else:
             # Stopped state
-            self.play_button.setEnabled(self.is_enabled)
-            self.pause_button.setEnabled(False)
-            self.stop_button.setEnabled(False)
+            _set_enabled(self.play_button, self.is_enabled)
+            _set_enabled(self.pause_button, False)
+            _set_enabled(self.stop_button, False)
             logger.debug("Playback state: Stopped")
     
     def reset(self):
         """Reset control panel to initial state."""
-        self.set_playback_position(0.0)
+        # Drop throttled updates so none fire after the reset
+        self._pos_update_timer.stop()
+        self._label_update_timer.stop()
+        self._seek_timer.stop()
+        self._pending_pos = 0.0
+        self._pending_slider_value = 0
+        self._seek_pending = False
+        
+        self.current_time = 0.0
+        self._apply_playback_position(0.0)
         self.set_playing(False)
         self.set_enabled(False)
         self.total_duration = 0.0
+        self._duration_ms = 0
         self.time_label.setText('00:00')
+        self._last_time_str = '00:00'
         self.duration_label.setText('00:00')
-        self.speed_combo.setCurrentText('1.0x')
+        if self.speed_combo.currentIndex() != self.DEFAULT_SPEED_INDEX:
+            self.speed_combo.setCurrentIndex(self.DEFAULT_SPEED_INDEX)
         logger.debug("Control panel reset")
     
     # Helper Methods
     
-    def _update_time_label(self, time: float):
+    def _update_time_label(self, time_str: str):
         """
         Update the current time label.
         
         Args:
-            time: Current time in seconds
+            time_str: Formatted current time
         """
-        self.time_label.setText(self._format_time(time))
+        # Skip the repaint when the displayed second has not changed
+        if time_str != self._last_time_str:
+            self.time_label.setText(time_str)
+            self._last_time_str = time_str
     
     def _format_time(self, seconds: float) -> str:
         """
@@ -380,6 +423,32 @@ class ControlPanel(QWidget):
         Returns:
             Formatted time string
         """
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f'{minutes:02d}:{secs:02d}'
+        return self._format_whole_seconds(int(seconds))
+    
+    def _format_time_ms(self, ms: int) -> str:
+        """
+        Format time in milliseconds as MM:SS string.
+        
+        Args:
+            ms: Time in milliseconds
+        
+        Returns:
+            Formatted time string
+        """
+        return self._format_whole_seconds(ms // 1000)
+    
+    def _format_whole_seconds(self, whole: int) -> str:
+        """
+        Format a whole number of seconds as MM:SS string.
+        
+        Args:
+            whole: Time in whole seconds
+        
+        Returns:
+            Formatted time string
+        """
+        if 0 <= whole < len(_MMSS_TABLE):
+            return _MMSS_TABLE[whole]
+        
+        # An hour or longer
+        return f'{whole // 60:02d}:{whole % 60:02d}'
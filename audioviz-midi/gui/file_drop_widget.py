@@ -4,6 +4,8 @@ File Drop Widget for AudioViz MIDI.
 Provides a drag-and-drop area for easy audio file loading.
 """
 
+import logging
+import os
 from PyQt5.QtWidgets import QLabel, QVBoxLayout, QWidget
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QDragEnterEvent, QDropEvent, QPalette, QFont
@@ -24,7 +26,14 @@ class FileDropWidget(QLabel):
     file_dropped = pyqtSignal(str)
     
     # Supported audio file extensions
-    SUPPORTED_EXTENSIONS = ['.wav', '.mp3', '.flac', '.ogg']
+    SUPPORTED_EXTENSIONS = frozenset({'.wav', '.mp3', '.flac', '.ogg'})
+    
+    # Prompt shown while no file is loaded
+    DEFAULT_TEXT = (
+        '🎵 Drag & Drop Audio File Here\n\n'
+        'or click "Open Audio" button\n\n'
+        'Supported: WAV, MP3, FLAC, OGG'
+    )
     
     def __init__(self, parent=None):
         """
@@ -35,25 +44,32 @@ class FileDropWidget(QLabel):
         """
         super().__init__(parent)
         
+        # Styled by the #file_drop_widget rules of the application stylesheet
+        self.setObjectName('file_drop_widget')
+        
         # Enable drag and drop
         self.setAcceptDrops(True)
         
-        # Set up UI
+        # Set up UI, batching the resulting layout and paint events into one
+        self.setUpdatesEnabled(False)
         self._setup_ui()
+        self.setUpdatesEnabled(True)
         
         # Track drag state
         self.is_dragging = False
+        self._last_drag_url = None
+        
+        # Last path checked by _is_supported_file (Qt re-sends drag events
+        # with the same URL many times during one drag)
+        self._last_checked_path = None
+        self._last_checked_result = False
         
         logger.debug("FileDropWidget initialized")
     
     def _setup_ui(self):
         """Set up the widget appearance."""
         # Set text
-        self.setText(
-            '🎵 Drag & Drop Audio File Here\n\n'
-            'or click "Open Audio" button\n\n'
-            'Supported: WAV, MP3, FLAC, OGG'
-        )
+        self.setText(self.DEFAULT_TEXT)
         
         # Set alignment
         self.setAlignment(Qt.AlignCenter)
@@ -67,31 +83,24 @@ class FileDropWidget(QLabel):
         self.setMinimumHeight(200)
         
         # Apply default style
-        self._apply_default_style()
-    
-    def _apply_default_style(self):
-        """Apply default (non-dragging) style."""
-        self.setStyleSheet("""
-            QLabel {
-                background-color: #1e1e28;
-                color: #888;
-                border: 3px dashed #444;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
+        self._set_state('default')
     
-    def _apply_hover_style(self):
-        """Apply style when file is being dragged over."""
-        self.setStyleSheet("""
-            QLabel {
-                background-color: #2a2a38;
-                color: #4a9eff;
-                border: 3px dashed #4a9eff;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
+    def _set_state(self, state: str):
+        """
+        Switch the visual state used by the stylesheet.
+        
+        Re-polishing applies the matching [state="..."] rule without
+        re-parsing any stylesheet.
+        
+        Args:
+            state: One of 'default', 'hover', 'loaded' or 'processing'
+        """
+        if self.property('state') == state:
+            return
+        
+        self.setProperty('state', state)
+        self.style().unpolish(self)
+        self.style().polish(self)
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """
@@ -100,24 +109,40 @@ class FileDropWidget(QLabel):
         Args:
             event: Drag enter event
         """
-        # Check if dragged data contains URLs (files)
-        if event.mimeData().hasUrls():
-            # Get the first file
-            urls = event.mimeData().urls()
-            if urls:
-                file_path = urls[0].toLocalFile()
-                
-                # Check if it's a supported audio file
-                if self._is_supported_file(file_path):
-                    event.acceptProposedAction()
-                    self.is_dragging = True
-                    self._apply_hover_style()
-                    logger.debug(f"Drag entered with valid file: {file_path}")
-                else:
-                    event.ignore()
-                    logger.debug(f"Drag entered with unsupported file: {file_path}")
+        # Check if dragged data contains URLs (files) before parsing any
+        mime_data = event.mimeData()
+        if not mime_data.hasFormat('text/uri-list'):
+            event.ignore()
+            return
+        
+        # Get the first file
+        urls = mime_data.urls()
+        if not urls:
+            event.ignore()
+            return
+        
+        url = urls[0]
+        
+        # Qt re-sends drag enter for the same URL; hover state is already set
+        if self.is_dragging and url == self._last_drag_url:
+            event.acceptProposedAction()
+            return
+        
+        file_path = url.toLocalFile()
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        # Check if it's a supported audio file
+        if self._is_supported_file(file_path):
+            event.acceptProposedAction()
+            self.is_dragging = True
+            self._last_drag_url = url
+            self._set_state('hover')
+            if debug:
+                logger.debug("Drag entered with valid file: %s", file_path)
         else:
             event.ignore()
+            if debug:
+                logger.debug("Drag entered with unsupported file: %s", file_path)
     
     def dragLeaveEvent(self, event):
         """
@@ -127,7 +152,7 @@ class FileDropWidget(QLabel):
             event: Drag leave event
         """
         self.is_dragging = False
-        self._apply_default_style()
+        self._set_state('default')
         logger.debug("Drag left widget area")
     
     def dropEvent(self, event: QDropEvent):
@@ -156,7 +181,7 @@ class FileDropWidget(QLabel):
                 
                 # Reset style
                 self.is_dragging = False
-                self._apply_default_style()
+                self._set_state('default')
             else:
                 logger.warning(f"Dropped file has unsupported format: {file_path}")
                 event.ignore()
@@ -173,9 +198,15 @@ class FileDropWidget(QLabel):
         Returns:
             True if file extension is supported
         """
-        import os
+        if file_path == self._last_checked_path:
+            return self._last_checked_result
+        
         extension = os.path.splitext(file_path)[1].lower()
-        return extension in self.SUPPORTED_EXTENSIONS
+        result = extension in self.SUPPORTED_EXTENSIONS
+        
+        self._last_checked_path = file_path
+        self._last_checked_result = result
+        return result
     
     def set_file_loaded(self, filename: str):
         """
@@ -192,21 +223,22 @@ class FileDropWidget(QLabel):
         )
         
         # Apply loaded style
-        self.setStyleSheet("""
-            QLabel {
-                background-color: #1e2e1e;
-                color: #6c6;
-                border: 3px solid #4a9eff;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
+        self._set_state('loaded')
     
-    def reset(self):
-        """Reset widget to initial state."""
+    def set_processing(self, filename: str):
+        """
+        Update widget to show the file is being transcribed.
+        
+        Args:
+            filename: Name of the file being processed
+        """
         self.setText(
-            '🎵 Drag & Drop Audio File Here\n\n'
-            'or click "Open Audio" button\n\n'
-            'Supported: WAV, MP3, FLAC, OGG'
+            f'Processing Audio...\n\n{filename}\n\n'
+            'Please wait...'
         )
-        self._apply_default_style()
+        self._set_state('processing')
+    
+    def reset(self):
+        """Reset widget to initial state."""
+        self.setText(self.DEFAULT_TEXT)
+        self._set_state('default')
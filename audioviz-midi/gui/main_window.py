@@ -5,22 +5,23 @@ Creates the primary application window with menu bar, toolbar,
 central visualization area, control panel, and status bar.
 """
 
+import logging
+import os
+from functools import partial
+from typing import Optional
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QMenuBar, QMenu, QAction, QToolBar, QStatusBar,
-    QLabel, QFileDialog, QMessageBox, QProgressBar
+    QLabel, QFileDialog, QMessageBox, QProgressBar,
+    QDesktopWidget, QShortcut, QStackedWidget, QApplication
 )
-from playback import PlaybackController, PlaybackState
-from visualization import PianoRollRenderer
 from gui.control_panel import ControlPanel
-from visualization import PygameWidget
-from gui.processing_thread import ProcessingThread
+from gui.processing_thread import ProcessingWorker
 from gui.file_drop_widget import FileDropWidget
-from PyQt5.QtCore import Qt, QTimer, QSize
+from PyQt5.QtCore import Qt, QTimer, QSize, QThreadPool
 from PyQt5.QtGui import QIcon, QKeySequence
 from utils.logger import get_logger
 from utils.config import ConfigManager
-from export import MIDIExporter, JSONExporter
 from utils import ErrorHandler
 from utils import get_performance_monitor
 
@@ -28,6 +29,66 @@ from utils import get_performance_monitor
 
 logger = get_logger(__name__)
 
+def _set_action_enabled(action: QAction, enabled: bool):
+    """Enable or disable an action, skipping Qt work if the state is unchanged."""
+    if action.isEnabled() != enabled:
+        action.setEnabled(enabled)
+
+
+# File dialogs keep the native OS picker and skip per-directory custom
+# icon lookups, which stat every folder when Qt's own dialog is used
+_FILE_DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons
+
+
+# Placeholder in _MENU_SPEC for the generated window size preset actions
+_WINDOW_SIZE_PRESETS = 'window_size_presets'
+
+# Menu bar layout: (menu title, items). Items are None for a separator or
+# (text, shortcut, status tip, slot name, enabled, attribute name) tuples.
+# Actions that start disabled are enabled once a transcription is complete.
+_MENU_SPEC = (
+    ('&File', (
+        ('&Open Audio...', QKeySequence.Open, 'Open an audio file for transcription',
+         '_on_open_file', True, 'open_action'),
+        None,
+        ('Export &MIDI...', 'Ctrl+M', 'Export as MIDI file',
+         '_on_export_midi', False, 'export_midi_action'),
+        ('Export &JSON...', 'Ctrl+J', 'Export as JSON file',
+         '_on_export_json', False, 'export_json_action'),
+        None,
+        ('E&xit', QKeySequence.Quit, 'Exit application', 'close', True, None),
+    )),
+    ('&Edit', (
+        ('&Settings...', 'Ctrl+,', 'Open settings dialog', '_on_settings', True, None),
+    )),
+    ('&View', (
+        ('&Fullscreen', 'F11', 'Toggle fullscreen mode',
+         '_on_toggle_fullscreen', True, 'fullscreen_action'),
+        None,
+        _WINDOW_SIZE_PRESETS,
+        ('Reset to &Default Size', 'Ctrl+0', 'Reset window to default size (1280x720)',
+         '_reset_window_size', True, None),
+    )),
+    ('&Help', (
+        ('&Keyboard Shortcuts...', 'F1', 'View keyboard shortcuts',
+         '_on_keyboard_shortcuts', True, None),
+        None,
+        ('&About...', None, 'About AudioViz MIDI', '_on_about', True, None),
+    )),
+)
+
+# Toolbar layout, same item format as _MENU_SPEC. A string names a menu
+# action that is shared with the toolbar rather than duplicated.
+_TOOLBAR_SPEC = (
+    'open_action',
+    None,
+    ('Transcribe', None, 'Start audio transcription', '_on_transcribe', False, 'transcribe_action'),
+    None,
+    'export_midi_action',
+    None,
+    ('Help', None, 'Show workflow help', '_show_workflow_help', True, None),
+)
+
 
 class MainWindow(QMainWindow):
     """
@@ -38,6 +99,36 @@ class MainWindow(QMainWindow):
     control panel for playback, and status bar for messages.
     """
     
+    # Message box templates
+    _PLAYBACK_WARNING_TMPL = 'Audio loaded but playback may not work:\n{}'
+    _TRANSCRIPTION_COMPLETE_TMPL = (
+        'Audio successfully transcribed!\n\n'
+        'Notes detected: {total_notes}\n'
+        'Duration: {duration:.1f}s\n\n'
+        'You can now export the MIDI file.'
+    )
+    _PROCESSING_ERROR_TMPL = 'Transcription failed:\n\n{}\n'
+    _WINDOW_TOO_LARGE_TMPL = (
+        'The requested window size ({}x{}) is larger than your screen.\n\n'
+        'Your screen size: {}x{}\n'
+        'Window will be resized to fit your screen instead.'
+    )
+    
+    # View menu window size presets: (name, width, height)
+    WINDOW_SIZE_PRESETS = (
+        ('1080p', 1920, 1080),
+        ('1440p', 2560, 1440),
+        ('4K', 3840, 2160),
+    )
+    
+    # Control panel playing flag and status message per PlaybackState value
+    # (keyed on values so playback/pygame is only imported on first use)
+    _PLAYBACK_STATE_UI = {
+        'playing': (True, 'Playing...'),
+        'paused': (False, 'Paused'),
+        'stopped': (False, 'Stopped'),
+    }
+    
     def __init__(self, config: ConfigManager = None):
         """
         Initialize the main window.
@@ -49,19 +140,46 @@ class MainWindow(QMainWindow):
         
         self.config = config or ConfigManager()
         
+        # In-memory copy of the 'ui' config section; changes are written
+        # back to disk by a debounced save instead of on every file load
+        self._ui_cfg = dict(self.config.get_section('ui'))
+        self._config_dirty = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(2000)
+        self._save_timer.timeout.connect(self._flush_config)
+        
         # Application state
         self.current_file = None
         self.is_processing = False
-        self.processing_thread = None
+        self.processing_worker = None
+        self._msgbox = None  # Reused message box (see _show_message)
+        self._presets_slot = None  # (menu, index) for deferred window size presets
         self.midi_data = None  # Store transcription result
+        self._midi_duration = 0.0  # Duration of midi_data, used for seeking
         self.pygame_widget = None  # Pygame visualization widget
-        self.playback_controller = PlaybackController() 
-        self.midi_exporter = MIDIExporter(config)
-        self.json_exporter = JSONExporter(config)
-        # Connect playback signals
-        self.playback_controller.state_changed.connect(self._on_playback_state_changed)
-        self.playback_controller.time_updated.connect(self._on_playback_time_updated)
-        self.playback_controller.playback_finished.connect(self._on_playback_finished)
+        self._renderer = None  # Piano roll renderer, created with the widget
+        # Playback and exporters are created on first use (see the
+        # properties below) so mixer and exporter setup stay off startup
+        self._playback_controller = None
+        self._midi_exporter = None
+        self._json_exporter = None
+        self._audio_loader = None
+        self._export_dir = None  # Resolved default export directory
+        
+        # Transcription runs on the shared thread pool; its progress is
+        # polled at ~30 Hz instead of being signalled per update
+        self._pool = QThreadPool.globalInstance()
+        self._progress_pump = QTimer(self)
+        self._progress_pump.setInterval(33)
+        self._progress_pump.timeout.connect(self._drain_progress)
+        
+        # Available screen area, queried once and refreshed when it changes
+        self._screen_rect = QDesktopWidget().availableGeometry()
+        self._screen_w, self._screen_h = self._screen_rect.width(), self._screen_rect.height()
+        primary_screen = QApplication.primaryScreen()
+        if primary_screen is not None:
+            primary_screen.availableGeometryChanged.connect(self._on_screen_geometry_changed)
         
         # Performance monitoring
         self.perf_monitor = get_performance_monitor()
@@ -72,6 +190,41 @@ class MainWindow(QMainWindow):
         
         logger.info("Main window initialized")
     
+    @property
+    def playback_controller(self):
+        """Playback controller, created and wired up on first access."""
+        if self._playback_controller is None:
+            from playback import PlaybackController
+            self._playback_controller = PlaybackController()
+            self._playback_controller.state_changed.connect(self._on_playback_state_changed)
+            self._playback_controller.time_updated.connect(self._on_playback_time_updated)
+            self._playback_controller.playback_finished.connect(self._on_playback_finished)
+        return self._playback_controller
+    
+    @property
+    def midi_exporter(self):
+        """MIDI exporter, created on first access."""
+        if self._midi_exporter is None:
+            from export import MIDIExporter
+            self._midi_exporter = MIDIExporter(self.config)
+        return self._midi_exporter
+    
+    @property
+    def json_exporter(self):
+        """JSON exporter, created on first access."""
+        if self._json_exporter is None:
+            from export import JSONExporter
+            self._json_exporter = JSONExporter(self.config)
+        return self._json_exporter
+    
+    @property
+    def audio_loader(self):
+        """Audio loader used to validate dropped files, created on first access."""
+        if self._audio_loader is None:
+            from audio import AudioLoader
+            self._audio_loader = AudioLoader(self.config)
+        return self._audio_loader
+    
     def _init_ui(self):
         """Initialize all UI components."""
         # Set window properties
@@ -89,9 +242,6 @@ class MainWindow(QMainWindow):
         # Create status bar
         self._create_status_bar()
         
-        # Apply dark theme
-        self._apply_theme()
-        
         # Set up keyboard shortcuts
         self._setup_keyboard_shortcuts()
 
@@ -102,24 +252,28 @@ class MainWindow(QMainWindow):
         # Set window title
         self.setWindowTitle("AudioViz MIDI - Audio to MIDI Converter")
         
-        # Load window size from config
-        width = self.config.get('ui', 'window_width', 1280)
-        height = self.config.get('ui', 'window_height', 720)
-        self.resize(width, height)
-        
         # Set minimum size
         self.setMinimumSize(800, 600)
         
-        # Center window on screen
-        self._center_window()
+        # Restore the saved geometry (size, position, maximized state)
+        geometry = self._ui_cfg.get('geometry')
+        if geometry and self.restoreGeometry(bytes.fromhex(geometry)):
+            logger.debug("Window geometry restored")
+            return
+        
+        # Otherwise load window size from config and center on screen
+        width = self._ui_cfg.get('window_width', 1280)
+        height = self._ui_cfg.get('window_height', 720)
+        self.resize(width, height)
+        if self._ui_cfg.get('center_window', True):
+            self._center_window()
         
-        logger.debug(f"Window size set to {width}x{height}")
+        logger.debug("Window size set to %sx%s", width, height)
     
     def _center_window(self):
         """Center the window on the screen."""
         frame_geometry = self.frameGeometry()
-        from PyQt5.QtWidgets import QDesktopWidget
-        center_point = QDesktopWidget().availableGeometry().center()
+        center_point = self._screen_rect.center()
         frame_geometry.moveCenter(center_point)
         self.move(frame_geometry.topLeft())
     
@@ -127,126 +281,92 @@ class MainWindow(QMainWindow):
         """Create the menu bar with File, Edit, View, and Help menus."""
         menubar = self.menuBar()
         
-        # File Menu
-        file_menu = menubar.addMenu('&File')
-        
-        # Open Audio action
-        open_action = QAction('&Open Audio...', self)
-        open_action.setShortcut(QKeySequence.Open)  # Ctrl+O
-        open_action.setStatusTip('Open an audio file for transcription')
-        open_action.triggered.connect(self._on_open_file)
-        file_menu.addAction(open_action)
-        
-        file_menu.addSeparator()
-        
-        # Export MIDI action
-        export_midi_action = QAction('Export &MIDI...', self)
-        export_midi_action.setShortcut('Ctrl+M')
-        export_midi_action.setStatusTip('Export as MIDI file')
-        export_midi_action.setEnabled(False)  # Disabled until transcription complete
-        export_midi_action.triggered.connect(self._on_export_midi)
-        file_menu.addAction(export_midi_action)
-        self.export_midi_action = export_midi_action
-        
-        # Export JSON action
-        export_json_action = QAction('Export &JSON...', self)
-        export_json_action.setShortcut('Ctrl+J')
-        export_json_action.setStatusTip('Export as JSON file')
-        export_json_action.setEnabled(False)  # Disabled until transcription complete
-        export_json_action.triggered.connect(self._on_export_json)
-        file_menu.addAction(export_json_action)
-        self.export_json_action = export_json_action
-        
-        file_menu.addSeparator()
-        
-        # Exit action
-        exit_action = QAction('E&xit', self)
-        exit_action.setShortcut(QKeySequence.Quit)  # Ctrl+Q
-        exit_action.setStatusTip('Exit application')
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Edit Menu
-        edit_menu = menubar.addMenu('&Edit')
-        
-        # Settings action
-        settings_action = QAction('&Settings...', self)
-        settings_action.setShortcut('Ctrl+,')
-        settings_action.setStatusTip('Open settings dialog')
-        settings_action.triggered.connect(self._on_settings)
-        edit_menu.addAction(settings_action)
-        
-        # View Menu
-        view_menu = menubar.addMenu('&View')
-        
-        # Fullscreen action
-        fullscreen_action = QAction('&Fullscreen', self)
-        fullscreen_action.setShortcut('F11')
-        fullscreen_action.setStatusTip('Toggle fullscreen mode')
-        fullscreen_action.setCheckable(True)
-        fullscreen_action.triggered.connect(self._on_toggle_fullscreen)
-        view_menu.addAction(fullscreen_action)
-        self.fullscreen_action = fullscreen_action
-        
-        view_menu.addSeparator()
+        for title, items in _MENU_SPEC:
+            menu = menubar.addMenu(title)
+            for item in items:
+                if item is None:
+                    menu.addSeparator()
+                elif item == _WINDOW_SIZE_PRESETS:
+                    # Built when the menu is first opened; they have no
+                    # shortcuts, so nothing needs them before that
+                    self._presets_slot = (menu, len(menu.actions()))
+                    menu.aboutToShow.connect(self._populate_window_size_presets)
+                else:
+                    self._add_action(menu, *item)
+        
+        self.fullscreen_action.setCheckable(True)
+        
+        # Actions that need a finished transcription (see _apply_workflow_state)
+        self._export_actions = (self.export_midi_action, self.export_json_action)
+        
+        logger.debug("Menu bar created")
+    
+    def _add_action(self, container, text: str, shortcut, status_tip: str,
+                    slot_name: str, enabled: bool = True,
+                    attr: Optional[str] = None) -> QAction:
+        """
+        Create a QAction, wire it up and add it to a menu or toolbar.
+        
+        Args:
+            container: QMenu or QToolBar to add the action to
+            text: Action text
+            shortcut: Key sequence (string or QKeySequence.StandardKey), or None
+            status_tip: Status bar tip
+            slot_name: Name of the MainWindow method triggered by the action
+            enabled: Initial enabled state
+            attr: Attribute name to store the action under, or None
+        
+        Returns:
+            The created action
+        """
+        action = QAction(text, self)
+        if shortcut is not None:
+            action.setShortcut(shortcut)
+        action.setStatusTip(status_tip)
+        if not enabled:
+            action.setEnabled(False)
+        action.triggered.connect(getattr(self, slot_name))
+        container.addAction(action)
+        
+        if attr is not None:
+            setattr(self, attr, action)
+        
+        return action
+    
+    def _populate_window_size_presets(self):
+        """Add the window size presets the first time the View menu is shown."""
+        if self._presets_slot is None:
+            return
+        
+        menu, index = self._presets_slot
+        self._presets_slot = None
+        menu.aboutToShow.disconnect(self._populate_window_size_presets)
+        
+        actions = menu.actions()
+        before = actions[index] if index < len(actions) else None
+        self._add_window_size_presets(menu, before)
+    
+    def _add_window_size_presets(self, menu: QMenu, before: Optional[QAction] = None):
+        """
+        Add the window size preset actions to the View menu.
         
+        Args:
+            menu: Menu to add the presets to
+            before: Action to insert the presets before (None appends)
+        """
         # Get screen size for validation
         screen_width, screen_height = self._get_screen_size()
         
         # Window size presets with screen size validation
-        size_1080p_action = QAction('1080p (1920x1080)', self)
-        size_1080p_action.setStatusTip('Resize window to 1080p')
-        size_1080p_action.triggered.connect(lambda: self._set_window_size(1920, 1080))
-        # Disable if too large for screen
-        if 1920 > screen_width or 1080 > screen_height:
-            size_1080p_action.setEnabled(False)
-            size_1080p_action.setText('1080p (1920x1080) - Too large for screen')
-        view_menu.addAction(size_1080p_action)
-        
-        size_1440p_action = QAction('1440p (2560x1440)', self)
-        size_1440p_action.setStatusTip('Resize window to 1440p')
-        size_1440p_action.triggered.connect(lambda: self._set_window_size(2560, 1440))
-        # Disable if too large for screen
-        if 2560 > screen_width or 1440 > screen_height:
-            size_1440p_action.setEnabled(False)
-            size_1440p_action.setText('1440p (2560x1440) - Too large for screen')
-        view_menu.addAction(size_1440p_action)
-        
-        size_4k_action = QAction('4K (3840x2160)', self)
-        size_4k_action.setStatusTip('Resize window to 4K')
-        size_4k_action.triggered.connect(lambda: self._set_window_size(3840, 2160))
-        # Disable if too large for screen
-        if 3840 > screen_width or 2160 > screen_height:
-            size_4k_action.setEnabled(False)
-            size_4k_action.setText('4K (3840x2160) - Too large for screen')
-        view_menu.addAction(size_4k_action)
-        
-        # Reset to default size action
-        reset_size_action = QAction('Reset to &Default Size', self)
-        reset_size_action.setShortcut('Ctrl+0')
-        reset_size_action.setStatusTip('Reset window to default size (1280x720)')
-        reset_size_action.triggered.connect(self._reset_window_size)
-        view_menu.addAction(reset_size_action)
-        
-        # Help Menu
-        help_menu = menubar.addMenu('&Help')
-        
-        # Keyboard Shortcuts action - ADD THIS
-        shortcuts_action = QAction('&Keyboard Shortcuts...', self)
-        shortcuts_action.setShortcut('F1')
-        shortcuts_action.setStatusTip('View keyboard shortcuts')
-        shortcuts_action.triggered.connect(self._on_keyboard_shortcuts)
-        help_menu.addAction(shortcuts_action)
-        
-        help_menu.addSeparator()
-        
-        # About action
-        about_action = QAction('&About...', self)
-        about_action.setStatusTip('About AudioViz MIDI')
-        about_action.triggered.connect(self._on_about)
-        help_menu.addAction(about_action)
-        
-        logger.debug("Menu bar created")
+        for name, width, height in self.WINDOW_SIZE_PRESETS:
+            size_action = QAction(f'{name} ({width}x{height})', self)
+            size_action.setStatusTip(f'Resize window to {name}')
+            size_action.triggered.connect(partial(self._set_window_size, width, height))
+            # Disable if too large for screen
+            if width > screen_width or height > screen_height:
+                size_action.setEnabled(False)
+                size_action.setText(f'{name} ({width}x{height}) - Too large for screen')
+            menu.insertAction(before, size_action)
     
     def _check_workflow_state(self) -> dict:
         """
@@ -265,12 +385,17 @@ class MainWindow(QMainWindow):
         }
 
 
+    def _apply_workflow_state(self):
+        """Enable or disable the transcribe and export actions for the current state."""
+        state = self._check_workflow_state()
+        can_export = state['can_export'] and not state['is_processing']
+        
+        _set_action_enabled(self.transcribe_action, state['can_transcribe'])
+        for action in self._export_actions:
+            _set_action_enabled(action, can_export)
 
     def _setup_keyboard_shortcuts(self):
         """Set up additional keyboard shortcuts beyond menu items."""
-        from PyQt5.QtWidgets import QShortcut
-        from PyQt5.QtGui import QKeySequence
-        
         # Spacebar for Play/Pause toggle
         self.play_pause_shortcut = QShortcut(QKeySequence(Qt.Key_Space), self)
         self.play_pause_shortcut.activated.connect(self._toggle_play_pause)
@@ -286,6 +411,17 @@ class MainWindow(QMainWindow):
         self.seek_backward_shortcut = QShortcut(QKeySequence(Qt.Key_Left), self)
         self.seek_backward_shortcut.activated.connect(self._seek_backward)
         
+        # Playback shortcuts stay disabled until there is something to play,
+        # so Qt doesn't dispatch them before a transcription exists
+        self._playback_shortcuts = (
+            self.play_pause_shortcut,
+            self.stop_shortcut,
+            self.seek_forward_shortcut,
+            self.seek_backward_shortcut,
+        )
+        for shortcut in self._playback_shortcuts:
+            shortcut.setEnabled(False)
+        
         # Ctrl+T for transcribe
         self.transcribe_shortcut = QShortcut(QKeySequence('Ctrl+T'), self)
         self.transcribe_shortcut.activated.connect(self._on_transcribe)
@@ -298,16 +434,14 @@ class MainWindow(QMainWindow):
 
     def _toggle_play_pause(self):
         """Toggle between play and pause (Spacebar)."""
-        from playback import PlaybackState
-        
         if not self.midi_data:
             return
         
         state = self.playback_controller.get_state()
         
-        if state == PlaybackState.PLAYING:
+        if state.value == 'playing':
             self._on_pause()
-        elif state in [PlaybackState.STOPPED, PlaybackState.PAUSED]:
+        elif state.value in ('stopped', 'paused'):
             self._on_play()
     
     def _seek_forward(self):
@@ -316,15 +450,14 @@ class MainWindow(QMainWindow):
             return
         
         current_time = self.playback_controller.get_current_time()
-        stats = self.midi_data.get_statistics()
-        duration = stats['duration']
+        duration = self._midi_duration
         
         # Move forward 5 seconds
         new_time = min(current_time + 5.0, duration)
         position = new_time / duration if duration > 0 else 0
         
         self.playback_controller.seek(position)
-        logger.debug(f"Seek forward to {new_time:.1f}s")
+        logger.debug("Seek forward to %.1fs", new_time)
     
     def _seek_backward(self):
         """Seek backward 5 seconds (Left Arrow)."""
@@ -332,15 +465,14 @@ class MainWindow(QMainWindow):
             return
         
         current_time = self.playback_controller.get_current_time()
-        stats = self.midi_data.get_statistics()
-        duration = stats['duration']
+        duration = self._midi_duration
         
         # Move backward 5 seconds
         new_time = max(current_time - 5.0, 0.0)
         position = new_time / duration if duration > 0 else 0
         
         self.playback_controller.seek(position)
-        logger.debug(f"Seek backward to {new_time:.1f}s")
+        logger.debug("Seek backward to %.1fs", new_time)
 
 
 
@@ -351,41 +483,14 @@ class MainWindow(QMainWindow):
         toolbar.setMovable(False)
         self.addToolBar(toolbar)
         
-        # Open Audio button
-        open_audio_action = QAction('Open Audio', self)
-        open_audio_action.setStatusTip('Open an audio file')
-        open_audio_action.triggered.connect(self._on_open_file)
-        toolbar.addAction(open_audio_action)
-        
-        toolbar.addSeparator()
+        for item in _TOOLBAR_SPEC:
+            if item is None:
+                toolbar.addSeparator()
+            elif isinstance(item, str):
+                toolbar.addAction(getattr(self, item))
+            else:
+                self._add_action(toolbar, *item)
         
-
-        # Transcribe button
-        transcribe_action = QAction('Transcribe', self)
-        transcribe_action.setStatusTip('Start audio transcription')
-        transcribe_action.setEnabled(False)  # Disabled until file loaded
-        transcribe_action.triggered.connect(self._on_transcribe)
-        toolbar.addAction(transcribe_action)
-        self.transcribe_action = transcribe_action
-        
-        toolbar.addSeparator()
-        
-        # Export button
-        export_action = QAction('Export', self)
-        export_action.setStatusTip('Export MIDI or JSON')
-        export_action.setEnabled(False)  # Disabled until transcription complete
-        export_action.triggered.connect(self._on_export_midi)
-        toolbar.addAction(export_action)
-        self.export_action = export_action
-        
-        toolbar.addSeparator()
-
-        # Help button
-        help_action = QAction('Help', self)
-        help_action.setStatusTip('Show workflow help')
-        help_action.triggered.connect(self._show_workflow_help)
-        toolbar.addAction(help_action)
-
         logger.debug("Toolbar created")
     
 
@@ -401,7 +506,6 @@ class MainWindow(QMainWindow):
         main_layout.setSpacing(10)
         
         # Create container for file drop and pygame visualization
-        from PyQt5.QtWidgets import QStackedWidget
         self.visualization_stack = QStackedWidget()
         
         # File drop widget (shown when no file loaded)
@@ -409,9 +513,8 @@ class MainWindow(QMainWindow):
         self.file_drop_widget.file_dropped.connect(self._on_file_dropped)
         self.visualization_stack.addWidget(self.file_drop_widget)  # Index 0
         
-        # Pygame visualization widget (shown during/after transcription)
-        self.pygame_widget = PygameWidget()
-        self.visualization_stack.addWidget(self.pygame_widget)  # Index 1
+        # Pygame visualization widget is created on first transcription
+        # (see _ensure_pygame_widget) to keep SDL setup off the startup path
         
         # Start with file drop widget
         self.visualization_stack.setCurrentIndex(0)
@@ -460,57 +563,6 @@ class MainWindow(QMainWindow):
         
         logger.debug("Status bar created")
     
-    def _apply_theme(self):
-        """Apply dark theme stylesheet."""
-        dark_theme = """
-        QMainWindow {
-            background-color: #1e1e28;
-        }
-        QMenuBar {
-            background-color: #252530;
-            color: #e0e0e0;
-            border-bottom: 1px solid #3a3a44;
-        }
-        QMenuBar::item:selected {
-            background-color: #3a3a44;
-        }
-        QMenu {
-            background-color: #252530;
-            color: #e0e0e0;
-            border: 1px solid #3a3a44;
-        }
-        QMenu::item:selected {
-            background-color: #3a3a44;
-        }
-        QToolBar {
-            background-color: #252530;
-            border-bottom: 1px solid #3a3a44;
-            spacing: 5px;
-            padding: 5px;
-        }
-        QStatusBar {
-            background-color: #252530;
-            color: #e0e0e0;
-            border-top: 1px solid #3a3a44;
-        }
-        QLabel {
-            color: #e0e0e0;
-        }
-        QProgressBar {
-            border: 1px solid #3a3a44;
-            border-radius: 3px;
-            text-align: center;
-            color: #e0e0e0;
-            background-color: #1e1e28;
-        }
-        QProgressBar::chunk {
-            background-color: #4a9eff;
-            border-radius: 2px;
-        }
-        """
-        self.setStyleSheet(dark_theme)
-        logger.debug("Dark theme applied")
-    
     # Event Handlers
     
     def _on_open_file(self):
@@ -518,37 +570,35 @@ class MainWindow(QMainWindow):
         logger.info("Open file dialog triggered")
         
         # Get last directory from config
-        last_dir = self.config.get('ui', 'last_directory', '')
+        last_dir = self._ui_cfg.get('last_directory', '')
         
         # Show file dialog
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             'Open Audio File',
             last_dir,
-            'Audio Files (*.wav *.mp3 *.flac *.ogg);;All Files (*.*)'
+            'Audio Files (*.wav *.mp3 *.flac *.ogg);;All Files (*.*)',
+            options=_FILE_DIALOG_OPTIONS
         )
         
         if file_path:
-            import os
-            
-            logger.info(f"File selected: {file_path}")
+            logger.info("File selected: %s", file_path)
             self.current_file = file_path
             
             # Update status
-            filename = os.path.basename(file_path)
+            directory, filename = os.path.split(file_path)
             self.set_status(f"Loaded: {filename}")
             
             # Save directory to config
-            self.config.set('ui', 'last_directory', os.path.dirname(file_path))
-            self.config.save_config()
+            self._set_ui_config('last_directory', directory)
             
             # Enable transcribe button
-            self.transcribe_action.setEnabled(True)
+            self._apply_workflow_state()
             
             # Update visualization widget to GREEN state
             self.file_drop_widget.set_file_loaded(filename)
             
-            logger.info(f"File loaded successfully via menu: {filename}")
+            logger.info("File loaded successfully via menu: %s", filename)
     
 
     def _on_file_dropped(self, file_path: str):
@@ -558,18 +608,14 @@ class MainWindow(QMainWindow):
         Args:
             file_path: Path to dropped file
         """
-        import os
+        logger.info("File dropped: %s", file_path)
         
-        logger.info(f"File dropped: {file_path}")
-        
-        # Get filename
-        filename = os.path.basename(file_path)
+        # Get directory and filename
+        directory, filename = os.path.split(file_path)
         
         try:
             # Validate file using AudioLoader
-            from audio import AudioLoader
-            loader = AudioLoader()
-            is_valid, message = loader.validate_file(file_path)
+            is_valid, message = self.audio_loader.validate_file(file_path)
             
             if is_valid:
                 # File is valid
@@ -579,16 +625,15 @@ class MainWindow(QMainWindow):
                 self.set_status(f"Loaded: {filename}")
                 
                 # Save directory to config
-                self.config.set('ui', 'last_directory', os.path.dirname(file_path))
-                self.config.save_config()
+                self._set_ui_config('last_directory', directory)
                 
                 # Enable transcribe button
-                self.transcribe_action.setEnabled(True)
+                self._apply_workflow_state()
                 
                 # Update visualization widget to GREEN state
                 self.file_drop_widget.set_file_loaded(filename)
                 
-                logger.info(f"File loaded successfully via drag-and-drop: {filename}")
+                logger.info("File loaded successfully via drag-and-drop: %s", filename)
                 
                 # Show success message if it's a warning (large file)
                 if 'Warning' in message:
@@ -627,10 +672,7 @@ class MainWindow(QMainWindow):
         
         # Update UI state
         self.is_processing = True
-        self.transcribe_action.setEnabled(False)
-        self.export_midi_action.setEnabled(False)
-        self.export_json_action.setEnabled(False)
-        self.export_action.setEnabled(False)
+        self._apply_workflow_state()
         
         # Show progress bar
         self.show_progress(True)
@@ -638,29 +680,28 @@ class MainWindow(QMainWindow):
         self.set_status("Processing...")
         
         # Show processing state on file drop widget
-        import os
-        self.file_drop_widget.setText(
-            f'Processing Audio...\n\n{os.path.basename(self.current_file)}\n\n'
-            'Please wait...'
-        )
-        self.file_drop_widget.setStyleSheet("""
-            QLabel {
-                background-color: #2a2a38;
-                color: #4a9eff;
-                border: 3px solid #4a9eff;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
-        
-        # Create and start processing thread
-        self.processing_thread = ProcessingThread(self.current_file)
-        self.processing_thread.progress_updated.connect(self._on_progress_updated)
-        self.processing_thread.processing_complete.connect(self._on_processing_complete)
-        self.processing_thread.processing_error.connect(self._on_processing_error)
-        self.processing_thread.start()
-        
-        logger.info("Background processing thread started")
+        self.file_drop_widget.set_processing(os.path.basename(self.current_file))
+        
+        # Create and start processing worker. The window keeps the reference,
+        # so the pool must not delete it.
+        self.processing_worker = ProcessingWorker(self.current_file)
+        self.processing_worker.setAutoDelete(False)
+        self.processing_worker.signals.processing_complete.connect(self._on_processing_complete)
+        self.processing_worker.signals.processing_error.connect(self._on_processing_error)
+        self._pool.start(self.processing_worker)
+        self._progress_pump.start()
+        
+        logger.info("Background processing worker started")
+    
+    def _drain_progress(self):
+        """Apply the latest progress report from the processing worker."""
+        # A report may still be pending after completion; don't resurrect it
+        if self.processing_worker is None or not self.is_processing:
+            return
+        
+        progress = self.processing_worker.take_progress()
+        if progress is not None:
+            self._on_progress_updated(*progress)
 
 
     def _on_progress_updated(self, percentage: int, message: str):
@@ -671,9 +712,13 @@ class MainWindow(QMainWindow):
             percentage: Progress percentage (0-100)
             message: Status message
         """
-        self.set_progress(percentage)
-        self.set_status(message)
-        logger.debug(f"Progress: {percentage}% - {message}")
+        # The worker repeats values between steps; skip unchanged widgets
+        if percentage != self.progress_bar.value():
+            self.set_progress(percentage)
+        if message != self.status_label.text():
+            self.set_status(message)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Progress: %d%% - %s", percentage, message)
     
 
     def _on_processing_complete(self, midi_data):
@@ -684,30 +729,31 @@ class MainWindow(QMainWindow):
             midi_data: MIDIData object with transcription results
         """
         logger.info("Processing completed successfully!")
+        self._progress_pump.stop()
         
         # Store MIDI data
         self.midi_data = midi_data
         
         # Get statistics ONCE at the beginning
         stats = midi_data.get_statistics()
+        self._midi_duration = stats['duration']
         
-        # Enable control panel and set duration
+        # Enable control panel, playback shortcuts and set duration
         self.control_panel.set_enabled(True)
         self.control_panel.set_duration(stats['duration'])
+        for shortcut in self._playback_shortcuts:
+            shortcut.setEnabled(True)
         
         # Update UI state
         self.is_processing = False
         self.show_progress(False)
         
-        # Enable export actions
-        self.export_midi_action.setEnabled(True)
-        self.export_json_action.setEnabled(True)
-        self.export_action.setEnabled(True)
+        # Enable export and re-transcribe actions
+        self._apply_workflow_state()
         
-        # CREATE AND SET UP PIANO ROLL RENDERER
-        renderer = PianoRollRenderer(self.pygame_widget.screen, self.config)
-        renderer.set_midi_data(midi_data)
-        self.pygame_widget.set_renderer(renderer)
+        # Set up the piano roll (widget and renderer are reused on re-transcription)
+        self._ensure_pygame_widget()
+        self._renderer.surface = self.pygame_widget.screen
         self.pygame_widget.set_midi_data(midi_data)
         
         # LOAD AUDIO FOR PLAYBACK
@@ -716,15 +762,14 @@ class MainWindow(QMainWindow):
             logger.info("Audio loaded for playback")
         except Exception as e:
             logger.error(f"Failed to load audio for playback: {e}")
-            from PyQt5.QtWidgets import QMessageBox
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Warning,
                 'Playback Warning',
-                f'Audio loaded but playback may not work:\n{e}'
+                self._PLAYBACK_WARNING_TMPL.format(e)
             )
         
         # Switch to Pygame visualization
-        self.visualization_stack.setCurrentIndex(1)
+        self.visualization_stack.setCurrentWidget(self.pygame_widget)
         
         # Update status
         self.set_status(
@@ -733,22 +778,32 @@ class MainWindow(QMainWindow):
         )
         
         # Show success message
-        from PyQt5.QtWidgets import QMessageBox
-        QMessageBox.information(
-            self,
+        self._show_message(
+            QMessageBox.Information,
             'Transcription Complete',
-            f'Audio successfully transcribed!\n\n'
-            f'Notes detected: {stats["total_notes"]}\n'
-            f'Duration: {stats["duration"]:.1f}s\n\n'
-            f'You can now export the MIDI file.'
+            self._TRANSCRIPTION_COMPLETE_TMPL.format(**stats)
         )
-        
-        # Enable transcribe button for re-processing
-        self.transcribe_action.setEnabled(True)
 
 
 
 
+    def _ensure_pygame_widget(self) -> QWidget:
+        """
+        Create the Pygame visualization widget and its renderer on first use.
+        
+        Returns:
+            The Pygame widget (added to the visualization stack)
+        """
+        if self.pygame_widget is None:
+            from visualization import PygameWidget, PianoRollRenderer
+            self.pygame_widget = PygameWidget()
+            self.visualization_stack.addWidget(self.pygame_widget)
+            self._renderer = PianoRollRenderer(self.pygame_widget.screen, self.config)
+            self.pygame_widget.set_renderer(self._renderer)
+            logger.debug("Pygame widget and renderer created")
+        
+        return self.pygame_widget
+    
     def _on_play(self):
         """Handle play button from control panel."""
         logger.info("Play requested from control panel")
@@ -777,7 +832,7 @@ class MainWindow(QMainWindow):
         Args:
             position: Position from 0.0 to 1.0
         """
-        logger.info(f"Seek requested to position: {position:.3f}")
+        logger.info("Seek requested to position: %.3f", position)
         self.playback_controller.seek(position)
     
     def _on_speed_changed(self, speed: float):
@@ -787,7 +842,7 @@ class MainWindow(QMainWindow):
         Args:
             speed: Speed multiplier
         """
-        logger.info(f"Speed changed to {speed}x")
+        logger.info("Speed changed to %sx", speed)
         self.playback_controller.set_speed(speed)
         self.set_status(f"Note: Speed control not fully implemented in MVP")
 
@@ -798,17 +853,13 @@ class MainWindow(QMainWindow):
         Args:
             state: New PlaybackState
         """
-        from playback import PlaybackState
-        
-        if state == PlaybackState.PLAYING:
-            self.control_panel.set_playing(True)
-            self.set_status("Playing...")
-        elif state == PlaybackState.PAUSED:
-            self.control_panel.set_playing(False)
-            self.set_status("Paused")
-        elif state == PlaybackState.STOPPED:
-            self.control_panel.set_playing(False)
-            self.set_status("Stopped")
+        entry = self._PLAYBACK_STATE_UI.get(state.value)
+        if entry is None:
+            return
+        
+        playing, message = entry
+        self.control_panel.set_playing(playing)
+        self.set_status(message)
     
     def _on_playback_time_updated(self, time: float):
         """
@@ -839,17 +890,17 @@ class MainWindow(QMainWindow):
             error_message: Error description
         """
         logger.error(f"Processing failed: {error_message}")
+        self._progress_pump.stop()
         
         # Update UI state
         self.is_processing = False
         self.show_progress(False)
-        self.transcribe_action.setEnabled(True)
+        self._apply_workflow_state()
         
         # Update status
         self.set_status("Processing failed")
         
         # Reset visualization widget
-        import os
         if self.current_file:
             self.file_drop_widget.set_file_loaded(os.path.basename(self.current_file))
         else:
@@ -871,13 +922,12 @@ class MainWindow(QMainWindow):
             suggestions.append("• Check the log files for detailed error information")
             suggestions.append("• Try a different audio file")
         
-        message = f"Transcription failed:\n\n{error_message}\n"
+        message = self._PROCESSING_ERROR_TMPL.format(error_message)
         
         if suggestions:
             message += "\nSuggestions:\n" + "\n".join(suggestions)
         
-        from PyQt5.QtWidgets import QMessageBox
-        QMessageBox.critical(self, 'Processing Error', message)
+        self._show_message(QMessageBox.Critical, 'Processing Error', message)
 
 
 
@@ -894,23 +944,10 @@ class MainWindow(QMainWindow):
         try:
             # Get default filename
             default_name = self.midi_exporter.get_default_filename(self.current_file)
-            default_dir = self.config.get('export', 'default_directory', 'exports')
-            
-            # Create exports directory if it doesn't exist
-            import os
-            if not os.path.exists(default_dir):
-                try:
-                    os.makedirs(default_dir)
-                except Exception as e:
-                    logger.warning(f"Could not create exports directory: {e}")
-                    default_dir = os.path.expanduser('~')  # Fall back to home directory
-            
-            default_path = os.path.join(default_dir, default_name)
+            default_path = os.path.join(self._export_directory(), default_name)
             
             # Show save dialog
-            from PyQt5.QtWidgets import QFileDialog
-            file_path, _ = QFileDialog.getSaveFileName(
-                self,
+            file_path = self._save_dialog(
                 'Export MIDI File',
                 default_path,
                 'MIDI Files (*.mid);;All Files (*.*)'
@@ -923,7 +960,6 @@ class MainWindow(QMainWindow):
                 
                 # Check if file exists and confirm overwrite
                 if os.path.exists(file_path):
-                    from PyQt5.QtWidgets import QMessageBox
                     reply = QMessageBox.question(
                         self,
                         'Confirm Overwrite',
@@ -938,7 +974,7 @@ class MainWindow(QMainWindow):
                 success = self.midi_exporter.export(self.midi_data, file_path)
                 
                 if success:
-                    logger.info(f"MIDI exported to: {file_path}")
+                    logger.info("MIDI exported to: %s", file_path)
                     self.set_status(f"MIDI exported: {os.path.basename(file_path)}")
                     
                     ErrorHandler.show_info(
@@ -966,23 +1002,10 @@ class MainWindow(QMainWindow):
         try:
             # Get default filename
             default_name = self.json_exporter.get_default_filename(self.current_file)
-            default_dir = self.config.get('export', 'default_directory', 'exports')
-            
-            # Create exports directory if it doesn't exist
-            import os
-            if not os.path.exists(default_dir):
-                try:
-                    os.makedirs(default_dir)
-                except Exception as e:
-                    logger.warning(f"Could not create exports directory: {e}")
-                    default_dir = os.path.expanduser('~')
-            
-            default_path = os.path.join(default_dir, default_name)
+            default_path = os.path.join(self._export_directory(), default_name)
             
             # Show save dialog
-            from PyQt5.QtWidgets import QFileDialog
-            file_path, _ = QFileDialog.getSaveFileName(
-                self,
+            file_path = self._save_dialog(
                 'Export JSON File',
                 default_path,
                 'JSON Files (*.json);;All Files (*.*)'
@@ -995,7 +1018,6 @@ class MainWindow(QMainWindow):
                 
                 # Check if file exists and confirm overwrite
                 if os.path.exists(file_path):
-                    from PyQt5.QtWidgets import QMessageBox
                     reply = QMessageBox.question(
                         self,
                         'Confirm Overwrite',
@@ -1014,7 +1036,7 @@ class MainWindow(QMainWindow):
                 )
                 
                 if success:
-                    logger.info(f"JSON exported to: {file_path}")
+                    logger.info("JSON exported to: %s", file_path)
                     self.set_status(f"JSON exported: {os.path.basename(file_path)}")
                     
                     ErrorHandler.show_info(
@@ -1029,6 +1051,45 @@ class MainWindow(QMainWindow):
             ErrorHandler.handle_export_error(self, e, 'JSON', 
                 file_path if 'file_path' in locals() else 'unknown')
 
+    def _export_directory(self) -> str:
+        """
+        Get the default export directory, creating it on first use.
+        
+        Returns:
+            Export directory path (home directory if it cannot be created)
+        """
+        if self._export_dir is None:
+            export_dir = self.config.get('export', 'default_directory', 'exports')
+            try:
+                os.makedirs(export_dir, exist_ok=True)
+            except Exception as e:
+                logger.warning(f"Could not create exports directory: {e}")
+                export_dir = os.path.expanduser('~')  # Fall back to home directory
+            self._export_dir = export_dir
+        
+        return self._export_dir
+    
+    def _save_dialog(self, caption: str, default_path: str, file_filter: str) -> str:
+        """
+        Ask for a save path using the native file dialog.
+        
+        Args:
+            caption: Dialog title
+            default_path: Initially selected path
+            file_filter: Name filters (e.g. 'MIDI Files (*.mid)')
+        
+        Returns:
+            Selected file path, or an empty string if cancelled
+        """
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            caption,
+            default_path,
+            file_filter,
+            options=_FILE_DIALOG_OPTIONS
+        )
+        return file_path
+
     def _validate_can_transcribe(self) -> bool:
         """
         Validate that transcription can proceed.
@@ -1047,13 +1108,13 @@ class MainWindow(QMainWindow):
             return False
         
         # Check file still exists
-        import os
         if not os.path.exists(self.current_file):
             ErrorHandler.show_warning(self, 'File Not Found', 
                 f'The audio file no longer exists:\n{self.current_file}\n\n'
                 'Please load the file again.')
             self.current_file = None
             self.file_drop_widget.reset()
+            self._apply_workflow_state()
             return False
         
         return True
@@ -1080,9 +1141,17 @@ class MainWindow(QMainWindow):
         Returns:
             Tuple of (width, height) for available screen area
         """
-        from PyQt5.QtWidgets import QDesktopWidget
-        screen = QDesktopWidget().availableGeometry()
-        return screen.width(), screen.height()
+        return self._screen_w, self._screen_h
+    
+    def _on_screen_geometry_changed(self, geometry):
+        """
+        Refresh the cached screen area and size.
+        
+        Args:
+            geometry: New available geometry of the primary screen
+        """
+        self._screen_rect = geometry
+        self._screen_w, self._screen_h = geometry.width(), geometry.height()
     
     def _set_window_size(self, width: int, height: int):
         """
@@ -1105,13 +1174,10 @@ class MainWindow(QMainWindow):
             logger.warning(f"Requested size {width}x{height} exceeds screen size {screen_width}x{screen_height}")
             
             # Show warning dialog
-            from PyQt5.QtWidgets import QMessageBox
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Warning,
                 'Window Size Too Large',
-                f'The requested window size ({width}x{height}) is larger than your screen.\n\n'
-                f'Your screen size: {screen_width}x{screen_height}\n'
-                f'Window will be resized to fit your screen instead.'
+                self._WINDOW_TOO_LARGE_TMPL.format(width, height, screen_width, screen_height)
             )
             
             # Resize to fit screen (maintaining aspect ratio if possible)
@@ -1129,7 +1195,7 @@ class MainWindow(QMainWindow):
         self.resize(width, height)
         self._center_window()
         
-        logger.info(f"Window resized to {width}x{height}")
+        logger.info("Window resized to %sx%s", width, height)
         self.set_status(f"Window size: {width}x{height}", timeout=3000)
 
     def _reset_window_size(self):
@@ -1176,13 +1242,64 @@ class MainWindow(QMainWindow):
         </table>
         """
         
-        QMessageBox.information(
-            self,
+        self._show_message(
+            QMessageBox.Information,
             'Keyboard Shortcuts',
             shortcuts_text
         )
 
     
+    def _show_message(self, icon, title: str, text: str):
+        """
+        Show a modal message box, reusing one QMessageBox instance.
+        
+        Args:
+            icon: QMessageBox icon (e.g. QMessageBox.Warning)
+            title: Window title
+            text: Message text (plain or rich text)
+        """
+        if self._msgbox is None:
+            self._msgbox = QMessageBox(self)
+        
+        box = self._msgbox
+        if box.isVisible():
+            # A message arrived while the shared box is open (e.g. a
+            # processing result during Help); don't overwrite or re-exec it
+            box = QMessageBox(self)
+            box.setAttribute(Qt.WA_DeleteOnClose)
+        
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.exec_()
+    
+    # Config Helpers
+    
+    def _set_ui_config(self, key: str, value):
+        """
+        Update a 'ui' setting and schedule a debounced config save.
+        
+        Args:
+            key: Configuration key within the 'ui' section
+            value: Value to set
+        """
+        if self._ui_cfg.get(key) == value:
+            return
+        
+        self._ui_cfg[key] = value
+        self._config_dirty = True
+        self._save_timer.start()
+    
+    def _flush_config(self):
+        """Write pending 'ui' settings back to the config file."""
+        if not self._config_dirty:
+            return
+        
+        for key, value in self._ui_cfg.items():
+            self.config.set('ui', key, value)
+        self.config.save_config()
+        self._config_dirty = False
+    
     # Public Methods
     
     def set_status(self, message: str, timeout: int = 0):
@@ -1193,10 +1310,13 @@ class MainWindow(QMainWindow):
             message: Status message to display
             timeout: Auto-clear timeout in milliseconds (0 = no timeout)
         """
+        if self.status_label.text() == message and timeout <= 0:
+            return
+        
         self.status_label.setText(message)
         if timeout > 0:
-            QTimer.singleShot(timeout, lambda: self._set_ready_status())
-        logger.debug(f"Status: {message}")
+            QTimer.singleShot(timeout, self._set_ready_status)
+        logger.debug("Status: %s", message)
     
     def _set_ready_status(self):
         """Set status to ready with workflow hint."""
@@ -1221,6 +1341,10 @@ class MainWindow(QMainWindow):
         Args:
             show: True to show, False to hide
         """
+        # isHidden() reflects the bar's own flag, independent of the window
+        if self.progress_bar.isHidden() != show:
+            return
+        
         self.progress_bar.setVisible(show)
         if not show:
             self.progress_bar.setValue(0)
@@ -1263,8 +1387,7 @@ class MainWindow(QMainWindow):
                 "Tip: Press F1 to see all keyboard shortcuts"
             )
         
-        from PyQt5.QtWidgets import QMessageBox
-        QMessageBox.information(self, 'Quick Help', message)
+        self._show_message(QMessageBox.Information, 'Quick Help', message)
 
 
 
@@ -1274,17 +1397,19 @@ class MainWindow(QMainWindow):
         self.perf_monitor.log_summary()
         
         # Clean up playback
-        if self.playback_controller:
-            self.playback_controller.cleanup()
+        if self._playback_controller is not None:
+            self._playback_controller.cleanup()
         
         # Clean up Pygame
-        if self.pygame_widget:
+        if self.pygame_widget is not None:
             self.pygame_widget.cleanup()
         
-        # Save window size to config
-        self.config.set('ui', 'window_width', self.width())
-        self.config.set('ui', 'window_height', self.height())
-        self.config.save_config()
+        # Save window geometry and any pending UI settings to config
+        self._set_ui_config('geometry', bytes(self.saveGeometry()).hex())
+        self._set_ui_config('window_width', self.width())
+        self._set_ui_config('window_height', self.height())
+        self._save_timer.stop()
+        self._flush_config()
         
         logger.info("Main window closing")
         event.accept()
@@ -4,15 +4,160 @@ Processing Thread for AudioViz MIDI.
 Handles audio transcription in a background thread to keep UI responsive.
 """
 
-from PyQt5.QtCore import QThread, pyqtSignal
-from audio import AudioLoader, PitchDetector, OnsetDetector
-from midi import MIDIConverter, NoteQuantizer
+import threading
+from typing import Callable, Optional, Tuple
+from PyQt5.QtCore import QObject, QRunnable, QThread, pyqtSignal
+from midi import MIDIConverter, MIDIData, NoteQuantizer
 from utils.logger import get_logger
 from utils.performance_monitor import get_performance_monitor
 
 logger = get_logger(__name__)
 
 
+def transcribe_audio(file_path: str,
+                     report_progress: Callable[[int, str], None],
+                     is_cancelled: Callable[[], bool]) -> Optional[MIDIData]:
+    """
+    Run the full audio-to-MIDI transcription pipeline.
+    
+    Args:
+        file_path: Path to audio file to process
+        report_progress: Called with (percentage, message) as steps complete
+        is_cancelled: Polled between steps; returning True aborts processing
+    
+    Returns:
+        Quantized MIDIData, or None if processing was cancelled
+    """
+    # Imported on first transcription so the GUI starts without the audio stack
+    from audio import AudioLoader, PitchDetector, OnsetDetector, FeatureCache
+    
+    perf = get_performance_monitor()
+    
+    logger.info("=" * 60)
+    logger.info("Starting Audio-to-MIDI Transcription")
+    logger.info("=" * 60)
+    
+    # Start overall timer
+    perf.start_timer('transcription')
+    perf.log_memory_usage("Start")
+    
+    # Step 1: Load audio (0-20%)
+    report_progress(0, "Loading audio file...")
+    logger.info("Step 1: Loading audio...")
+    perf.start_timer('audio_loading')
+    
+    loader = AudioLoader()
+    audio_data, sample_rate = loader.load_audio(file_path)
+    
+    perf.stop_timer('audio_loading')
+    perf.log_memory_usage("After audio loading")
+    
+    if is_cancelled():
+        return None
+    
+    audio_info = loader.get_audio_info()
+    logger.info(f"Audio loaded: {audio_info['duration']:.2f}s, {sample_rate} Hz")
+    report_progress(20, f"Audio loaded: {audio_info['duration']:.1f}s")
+    
+    # Spectrogram shared by pitch and onset detection (computed on first use)
+    features = FeatureCache(audio_data, sample_rate)
+    
+    # Step 2: Detect pitch (20-50%)
+    report_progress(20, "Detecting pitch...")
+    logger.info("Step 2: Detecting pitch...")
+    perf.start_timer('pitch_detection')
+    
+    pitch_detector = PitchDetector()
+    frequencies, confidences, times = pitch_detector.detect_pitch(
+        audio_data, sample_rate, feature_cache=features
+    )
+    
+    perf.stop_timer('pitch_detection')
+    perf.log_memory_usage("After pitch detection")
+    
+    if is_cancelled():
+        return None
+    
+    pitch_stats = pitch_detector.get_detection_stats()
+    logger.info(f"Pitch detection: {pitch_stats['frames_with_pitch']} frames detected")
+    report_progress(50, "Pitch detected")
+    
+    # Step 3: Detect onsets (50-65%)
+    report_progress(50, "Detecting note onsets...")
+    logger.info("Step 3: Detecting onsets...")
+    perf.start_timer('onset_detection')
+    
+    onset_detector = OnsetDetector()
+    onset_times, _ = onset_detector.detect_onsets(
+        audio_data, sample_rate, feature_cache=features
+    )
+    
+    perf.stop_timer('onset_detection')
+    
+    if is_cancelled():
+        return None
+    
+    onset_stats = onset_detector.get_detection_stats()
+    logger.info(f"Onset detection: {onset_stats['total_onsets']} onsets found")
+    report_progress(65, f"Found {len(onset_times)} notes")
+    
+    # Step 4: Convert to MIDI (65-80%)
+    report_progress(65, "Converting to MIDI...")
+    logger.info("Step 4: Converting to MIDI...")
+    perf.start_timer('midi_conversion')
+    
+    midi_converter = MIDIConverter()
+    midi_data = midi_converter.convert_to_midi(
+        frequencies, confidences, times, onset_times
+    )
+    
+    perf.stop_timer('midi_conversion')
+    
+    if is_cancelled():
+        return None
+    
+    logger.info(f"MIDI conversion: {len(midi_data)} notes created")
+    report_progress(80, f"Created {len(midi_data)} MIDI notes")
+    
+    # Step 5: Quantize/clean notes (80-95%)
+    report_progress(80, "Improving note quality...")
+    logger.info("Step 5: Quantizing notes...")
+    perf.start_timer('quantization')
+    
+    quantizer = NoteQuantizer()
+    midi_data_quantized = quantizer.quantize(midi_data)
+    
+    perf.stop_timer('quantization')
+    perf.log_memory_usage("After quantization")
+    
+    if is_cancelled():
+        return None
+    
+    logger.info(f"Quantization: {len(midi_data_quantized)} notes (filtered from {len(midi_data)})")
+    report_progress(95, "Finalizing...")
+    
+    # Step 6: Complete (95-100%)
+    total_time = perf.stop_timer('transcription')
+    
+    stats = midi_data_quantized.get_statistics()
+    logger.info("=" * 60)
+    logger.info("Transcription Complete!")
+    logger.info(f"Total notes: {stats['total_notes']}")
+    logger.info(f"Duration: {stats['duration']:.2f}s")
+    logger.info(f"Pitch range: {stats['pitch_range']}")
+    logger.info(f"Total processing time: {total_time:.2f}s")
+    logger.info("=" * 60)
+    
+    # Check performance targets
+    targets = perf.check_performance_targets()
+    if not targets.get('memory_ok', True):
+        logger.warning("Memory usage exceeded target (500MB)")
+    
+    report_progress(100, "Complete!")
+    
+    return midi_data_quantized
+
+
 class ProcessingThread(QThread):
     """
     Background thread for audio-to-MIDI transcription.
@@ -43,134 +188,101 @@ class ProcessingThread(QThread):
     
     def run(self):
         """Execute the processing pipeline in background thread."""
-        perf = get_performance_monitor()
-        
         try:
-            logger.info("=" * 60)
-            logger.info("Starting Audio-to-MIDI Transcription")
-            logger.info("=" * 60)
-            
-            # Start overall timer
-            perf.start_timer('transcription')
-            perf.log_memory_usage("Start")
-            
-            # Step 1: Load audio (0-20%)
-            self.progress_updated.emit(0, "Loading audio file...")
-            logger.info("Step 1: Loading audio...")
-            perf.start_timer('audio_loading')
-            
-            loader = AudioLoader()
-            audio_data, sample_rate = loader.load_audio(self.file_path)
-            
-            perf.stop_timer('audio_loading')
-            perf.log_memory_usage("After audio loading")
-            
-            if self.is_cancelled:
-                return
-            
-            audio_info = loader.get_audio_info()
-            logger.info(f"Audio loaded: {audio_info['duration']:.2f}s, {sample_rate} Hz")
-            self.progress_updated.emit(20, f"Audio loaded: {audio_info['duration']:.1f}s")
-            
-            # Step 2: Detect pitch (20-50%)
-            self.progress_updated.emit(20, "Detecting pitch...")
-            logger.info("Step 2: Detecting pitch...")
-            perf.start_timer('pitch_detection')
-            
-            pitch_detector = PitchDetector()
-            frequencies, confidences, times = pitch_detector.detect_pitch(
-                audio_data, sample_rate
+            midi_data = transcribe_audio(
+                self.file_path, self.progress_updated.emit, lambda: self.is_cancelled
             )
-            
-            perf.stop_timer('pitch_detection')
-            perf.log_memory_usage("After pitch detection")
-            
-            if self.is_cancelled:
-                return
-            
-            pitch_stats = pitch_detector.get_detection_stats()
-            logger.info(f"Pitch detection: {pitch_stats['frames_with_pitch']} frames detected")
-            self.progress_updated.emit(50, "Pitch detected")
-            
-            # Step 3: Detect onsets (50-65%)
-            self.progress_updated.emit(50, "Detecting note onsets...")
-            logger.info("Step 3: Detecting onsets...")
-            perf.start_timer('onset_detection')
-            
-            onset_detector = OnsetDetector()
-            onset_times, _ = onset_detector.detect_onsets(audio_data, sample_rate)
-            
-            perf.stop_timer('onset_detection')
-            
-            if self.is_cancelled:
-                return
-            
-            onset_stats = onset_detector.get_detection_stats()
-            logger.info(f"Onset detection: {onset_stats['total_onsets']} onsets found")
-            self.progress_updated.emit(65, f"Found {len(onset_times)} notes")
-            
-            # Step 4: Convert to MIDI (65-80%)
-            self.progress_updated.emit(65, "Converting to MIDI...")
-            logger.info("Step 4: Converting to MIDI...")
-            perf.start_timer('midi_conversion')
-            
-            midi_converter = MIDIConverter()
-            midi_data = midi_converter.convert_to_midi(
-                frequencies, confidences, times, onset_times
-            )
-            
-            perf.stop_timer('midi_conversion')
-            
-            if self.is_cancelled:
-                return
-            
-            logger.info(f"MIDI conversion: {len(midi_data)} notes created")
-            self.progress_updated.emit(80, f"Created {len(midi_data)} MIDI notes")
-            
-            # Step 5: Quantize/clean notes (80-95%)
-            self.progress_updated.emit(80, "Improving note quality...")
-            logger.info("Step 5: Quantizing notes...")
-            perf.start_timer('quantization')
-            
-            quantizer = NoteQuantizer()
-            midi_data_quantized = quantizer.quantize(midi_data)
-            
-            perf.stop_timer('quantization')
-            perf.log_memory_usage("After quantization")
-            
-            if self.is_cancelled:
-                return
-            
-            logger.info(f"Quantization: {len(midi_data_quantized)} notes (filtered from {len(midi_data)})")
-            self.progress_updated.emit(95, "Finalizing...")
-            
-            # Step 6: Complete (95-100%)
-            total_time = perf.stop_timer('transcription')
-            
-            stats = midi_data_quantized.get_statistics()
-            logger.info("=" * 60)
-            logger.info("Transcription Complete!")
-            logger.info(f"Total notes: {stats['total_notes']}")
-            logger.info(f"Duration: {stats['duration']:.2f}s")
-            logger.info(f"Pitch range: {stats['pitch_range']}")
-            logger.info(f"Total processing time: {total_time:.2f}s")
-            logger.info("=" * 60)
-            
-            # Check performance targets
-            targets = perf.check_performance_targets()
-            if not targets.get('memory_ok', True):
-                logger.warning("Memory usage exceeded target (500MB)")
-            
-            self.progress_updated.emit(100, "Complete!")
-            
-            # Emit completion signal
-            self.processing_complete.emit(midi_data_quantized)
+            if midi_data is not None:
+                self.processing_complete.emit(midi_data)
             
         except Exception as e:
             logger.error(f"Processing failed: {str(e)}", exc_info=True)
-            perf.log_memory_usage("Error state")
+            get_performance_monitor().log_memory_usage("Error state")
             self.processing_error.emit(str(e))
+    
+    def cancel(self):
+        """Cancel the processing operation."""
+        self.is_cancelled = True
+        logger.info("Processing cancelled by user")
 
+
+class ProcessingSignals(QObject):
+    """
+    Signals for ProcessingWorker (QRunnable cannot define signals itself).
+    
+    Signals:
+        processing_complete: Emitted with MIDIData object when complete
+        processing_error: Emitted with error message if processing fails
+    """
+    
+    processing_complete = pyqtSignal(object)  # (midi_data)
+    processing_error = pyqtSignal(str)  # (error_message)
+
+
+class ProcessingWorker(QRunnable):
+    """
+    Thread-pool task for audio-to-MIDI transcription.
+    
+    Unlike ProcessingThread, progress is not signalled: the worker keeps only
+    the latest (percentage, message) and the GUI polls it with take_progress()
+    on a timer, so bursts of progress updates never queue up in the event loop.
+    Completion and errors are still delivered once through `signals`.
+    """
+    
+    def __init__(self, file_path: str):
+        """
+        Initialize processing worker.
+        
+        Args:
+            file_path: Path to audio file to process
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.is_cancelled = False
+        self.signals = ProcessingSignals()
+        
+        # Latest progress report, overwritten by the worker and consumed by the GUI
+        self._progress_lock = threading.Lock()
+        self._latest_progress = None
+        
+        logger.debug(f"ProcessingWorker created for: {file_path}")
+    
+    def run(self):
+        """Execute the processing pipeline on a pool thread."""
+        try:
+            midi_data = transcribe_audio(
+                self.file_path, self._set_progress, lambda: self.is_cancelled
+            )
+            if midi_data is not None:
+                self.signals.processing_complete.emit(midi_data)
+            
+        except Exception as e:
+            logger.error(f"Processing failed: {str(e)}", exc_info=True)
+            get_performance_monitor().log_memory_usage("Error state")
+            self.signals.processing_error.emit(str(e))
+    
+    def _set_progress(self, percentage: int, message: str):
+        """
+        Store the latest progress report, replacing any unread one.
+        
+        Args:
+            percentage: Progress percentage (0-100)
+            message: Status message
+        """
+        with self._progress_lock:
+            self._latest_progress = (percentage, message)
+    
+    def take_progress(self) -> Optional[Tuple[int, str]]:
+        """
+        Get and clear the latest progress report.
+        
+        Returns:
+            (percentage, message), or None if nothing new was reported
+        """
+        with self._progress_lock:
+            progress = self._latest_progress
+            self._latest_progress = None
+        return progress
     
     def cancel(self):
         """Cancel the processing operation."""
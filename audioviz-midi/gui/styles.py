@@ -0,0 +1,38 @@
+# gui/styles.py
+"""
+Stylesheet loading for AudioViz MIDI.
+Reads the application-wide Qt stylesheet (styles.qss) shipped with the GUI package.
+"""
+
+import os
+from functools import lru_cache
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Stylesheet file next to this module
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'styles.qss')
+
+
+@lru_cache(maxsize=None)
+def load_stylesheet(path: str = STYLESHEET_PATH) -> str:
+    """
+    Read the application stylesheet.
+    
+    The file is read once per path; later calls return the cached text.
+    
+    Args:
+        path: Path to the .qss file
+    
+    Returns:
+        Stylesheet text, or an empty string if the file cannot be read
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            stylesheet = f.read()
+    except OSError as e:
+        logger.warning(f"Could not load stylesheet {path}: {e}")
+        return ''
+    
+    logger.debug(f"Loaded stylesheet: {path}")
+    return stylesheet
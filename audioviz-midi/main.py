@@ -6,7 +6,7 @@ Initializes the application and displays the main window.
 
 import sys
 from PyQt5.QtWidgets import QApplication
-from gui import MainWindow
+from gui import MainWindow, load_stylesheet
 from utils import setup_logging, ConfigManager
 
 def main():
@@ -25,6 +25,9 @@ def main():
     app.setApplicationName("AudioViz MIDI")
     app.setOrganizationName("AudioViz")
     
+    # Apply the dark theme once for the whole application
+    app.setStyleSheet(load_stylesheet())
+    
     # Create and show main window
     main_window = MainWindow(config)
     main_window.show()
@@ -4,7 +4,7 @@ MIDI Data Collection Management for AudioViz MIDI.
 Manages collections of Note objects with query and manipulation methods.
 """
 
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 import numpy as np
 from midi.note import Note
 from utils.logger import get_logger
@@ -29,6 +29,10 @@ class MIDIData:
         """
         self._notes = []
         
+        # Bumped on every mutation; invalidates the cached statistics
+        self._version = 0
+        self._stats_cache = None
+        
         if notes:
             for note in notes:
                 self.add_note(note)
@@ -49,6 +53,7 @@ class MIDIData:
         self._notes.append(note)
         # Keep notes sorted by start time for efficient queries
         self._notes.sort()
+        self._version += 1
         
         logger.debug(f"Added {note}")
     
@@ -73,6 +78,15 @@ class MIDIData:
         """
         return self._notes.copy()
     
+    def iter_notes(self) -> Iterator[Note]:
+        """
+        Iterate over notes in chronological order without copying the list.
+        
+        Returns:
+            Iterator over Note objects
+        """
+        return iter(self._notes)
+    
     def get_notes_at_time(self, time: float) -> List[Note]:
         """
         Get all notes active at a specific time.
@@ -137,6 +151,7 @@ class MIDIData:
         """
         try:
             self._notes.remove(note)
+            self._version += 1
             logger.debug(f"Removed {note}")
             return True
         except ValueError:
@@ -147,6 +162,7 @@ class MIDIData:
         """Remove all notes from the collection."""
         count = len(self._notes)
         self._notes.clear()
+        self._version += 1
         logger.info(f"Cleared {count} notes from collection")
     
     def get_duration(self) -> float:
@@ -178,6 +194,23 @@ class MIDIData:
         """
         Get statistical information about the note collection.
         
+        Results are cached until the collection is next modified.
+        
+        Returns:
+            Dictionary with various statistics
+        """
+        if self._stats_cache is not None and self._stats_cache[0] == self._version:
+            return dict(self._stats_cache[1])
+        
+        stats = self._compute_statistics()
+        self._stats_cache = (self._version, stats)
+        
+        return dict(stats)
+    
+    def _compute_statistics(self) -> dict:
+        """
+        Compute statistics over all notes (uncached).
+        
         Returns:
             Dictionary with various statistics
         """
@@ -219,6 +252,68 @@ class MIDIData:
         """
         return [note.to_dict() for note in self._notes]
     
+    def notes_and_stats(self) -> Tuple[List[dict], dict]:
+        """
+        Convert notes to dictionaries and compute statistics in one pass.
+        
+        Equivalent to to_dict_list() plus get_statistics(), but walks the
+        note list only once. The statistics are stored in the stats cache.
+        
+        Returns:
+            Tuple of (list of note dictionaries, statistics dictionary)
+        """
+        if not self._notes:
+            return [], self.get_statistics()
+        
+        note_dicts = []
+        min_pitch = max_pitch = self._notes[0].pitch
+        min_duration = max_duration = self._notes[0].duration
+        min_velocity = max_velocity = self._notes[0].velocity
+        total_duration = 0.0
+        total_velocity = 0
+        
+        for note in self._notes:
+            note_dict = note.to_dict()
+            note_dicts.append(note_dict)
+            
+            pitch = note_dict['pitch']
+            duration = note_dict['duration']
+            velocity = note_dict['velocity']
+            
+            if pitch < min_pitch:
+                min_pitch = pitch
+            elif pitch > max_pitch:
+                max_pitch = pitch
+            if duration < min_duration:
+                min_duration = duration
+            elif duration > max_duration:
+                max_duration = duration
+            if velocity < min_velocity:
+                min_velocity = velocity
+            elif velocity > max_velocity:
+                max_velocity = velocity
+            
+            total_duration += duration
+            total_velocity += velocity
+        
+        count = len(note_dicts)
+        stats = {
+            'total_notes': count,
+            'duration': self.get_duration(),
+            'pitch_range': (min_pitch, max_pitch),
+            'avg_note_duration': float(total_duration / count),
+            'min_note_duration': float(min_duration),
+            'max_note_duration': float(max_duration),
+            'avg_velocity': float(total_velocity / count),
+            'min_velocity': int(min_velocity),
+            'max_velocity': int(max_velocity),
+            'first_note_time': self._notes[0].start_time,
+            'last_note_time': self._notes[-1].end_time
+        }
+        self._stats_cache = (self._version, stats)
+        
+        return note_dicts, dict(stats)
+    
     @classmethod
     def from_dict_list(cls, data: List[dict]) -> 'MIDIData':
         """
@@ -4,6 +4,7 @@ Test script for Audio Loader Module.
 Tests audio loading, preprocessing, and validation functionality.
 """
 
+import os
 from audio import AudioLoader
 from utils import setup_logging
 import numpy as np
@@ -47,12 +48,57 @@ def main():
         for key, value in info.items():
             logger.info(f"{key}: {value}")
         
+        # Test 5: Normalization scales the peak to 1.0 without distorting the signal
+        print("\n--- Test 5: Loading with normalization ---")
+        test_normalization(logger)
+        
+        # Test 6: A cached load returns the same signal as a fresh decode
+        print("\n--- Test 6: Loading from the decode cache ---")
+        test_cache_roundtrip(logger)
+        
         print("\n✓ All tests passed! Audio Loader is working correctly.")
         
     except Exception as e:
         logger.error(f"Test failed: {str(e)}")
         print("\n✗ Test failed. Check logs for details.")
 
+def test_normalization(logger):
+    """Load a quiet file with normalization on and compare to the raw samples."""
+    import soundfile as sf
+    
+    quiet = create_test_audio() * 0.002  # Peak 0.001
+    sf.write('test_audio_quiet.wav', quiet, 22050, subtype='FLOAT')
+    
+    loader = AudioLoader()
+    loader.normalize = True
+    loader.cache_decoded = False
+    audio_data, _ = loader.load_audio('test_audio_quiet.wav')
+    
+    peak = np.max(np.abs(audio_data))
+    expected = quiet / np.max(np.abs(quiet))
+    max_error = np.max(np.abs(audio_data - expected))
+    logger.info(f"Normalized peak: {peak:.6f}, max error vs raw/peak: {max_error:.2e}")
+    
+    assert abs(peak - 1.0) < 1e-5, f"Peak after normalization is {peak}"
+    assert max_error < 1e-5, f"Normalized signal differs from raw/peak by {max_error}"
+
+def test_cache_roundtrip(logger):
+    """Load the quiet file twice through the decode cache and compare."""
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        loader = AudioLoader()
+        loader.cache_decoded = True
+        loader.cache_dir = cache_dir
+        
+        fresh, _ = loader.load_audio('test_audio_quiet.wav')
+        assert os.listdir(cache_dir), "Decoded audio was not cached"
+        cached, _ = loader.load_audio('test_audio_quiet.wav')
+    
+    max_error = np.max(np.abs(fresh - cached))
+    logger.info(f"Cached vs fresh load max difference: {max_error:.2e}")
+    assert max_error == 0.0, f"Cached load differs from fresh decode by {max_error}"
+
 def create_test_audio():
     """Create a simple test audio signal (1 second, 440 Hz sine wave)."""
     import numpy as np
@@ -74,6 +74,23 @@ def main():
         status = "✓" if note == expected else "✗"
         logger.info(f"{status} {freq} Hz -> {note} (expected: {expected})")
     
+    # Test 7: Batched note names must match the scalar conversion
+    print("\n--- Test 7: Testing batched frequency to note name conversion ---")
+    sweep = 440.0 * 2.0 ** ((np.arange(24, 97) - 69 + 0.3) / 12)  # C1-C7, detuned
+    batch = np.concatenate([test_frequencies, sweep, frequencies_pyin])
+    
+    batch_names = PitchDetector.frequencies_to_note_names(batch)
+    scalar_names = [PitchDetector.frequency_to_note_name(freq) for freq in batch]
+    mismatches = [
+        (freq, name, expected)
+        for freq, name, expected in zip(batch, batch_names, scalar_names)
+        if name != expected
+    ]
+    status = "✓" if not mismatches and batch_names[4] == 'N/A' else "✗"
+    logger.info(f"{status} {len(batch)} frequencies, {len(mismatches)} mismatches")
+    for freq, name, expected in mismatches[:5]:
+        logger.info(f"✗ {freq} Hz -> {name} (expected: {expected})")
+    
     print("\n✓ All tests completed! Check results above.")
 
 def create_test_audio_with_pitch(frequency, duration=1.0, sample_rate=22050):
@@ -0,0 +1,108 @@
+# tests/test_batch_export.py
+"""
+Tests for export.export_all.
+Checks the concurrent MIDI + JSON export against the individual exporters.
+"""
+
+import sys
+import os
+import json
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from export import MIDIExporter, JSONExporter, export_all
+from midi import MIDIData, Note
+from utils import setup_logging
+
+logger = setup_logging()
+
+
+def create_test_midi_data():
+    """Create a short C major scale."""
+    notes = [
+        Note(pitch=pitch, start_time=i * 0.5, end_time=i * 0.5 + 0.4, velocity=80)
+        for i, pitch in enumerate([60, 62, 64, 65, 67, 69, 71, 72])
+    ]
+    return MIDIData(notes)
+
+
+def load_json(path):
+    """Load an exported JSON file without its export timestamp."""
+    with open(path) as f:
+        data = json.load(f)
+    data.get('metadata', {}).pop('export_date', None)
+    return data
+
+
+def test_matches_individual_exports(midi_data):
+    """Test that export_all writes the same files as the two exporters."""
+    logger.info("Comparing export_all with individual exports...")
+    
+    try:
+        midi_exporter = MIDIExporter()
+        json_exporter = JSONExporter()
+        
+        assert midi_exporter.export(midi_data, 'test_batch_ref.mid'), "MIDI export failed"
+        assert json_exporter.export(midi_data, 'test_batch_ref.json', 'scale.wav'), "JSON export failed"
+        
+        results = export_all(
+            midi_data, 'test_batch.mid', 'test_batch.json', 'scale.wav',
+            midi_exporter=midi_exporter, json_exporter=json_exporter
+        )
+        assert results == (True, True), f"export_all returned {results}"
+        
+        with open('test_batch.mid', 'rb') as f, open('test_batch_ref.mid', 'rb') as ref:
+            assert f.read() == ref.read(), "MIDI files differ"
+        logger.info("✓ MIDI files identical")
+        
+        assert load_json('test_batch.json') == load_json('test_batch_ref.json'), "JSON files differ"
+        logger.info("✓ JSON files match (ignoring export date)")
+        
+        return True
+        
+    except Exception as e:
+        logger.error(f"✗ export_all comparison failed: {e}")
+        return False
+
+
+def test_empty_data():
+    """Test that export_all reports failure for both files on empty data."""
+    logger.info("\nTesting export_all with empty data...")
+    
+    try:
+        results = export_all(MIDIData([]), 'test_batch_empty.mid', 'test_batch_empty.json')
+        assert results == (False, False), f"export_all returned {results}"
+        logger.info("✓ Empty data rejected by both exporters")
+        return True
+        
+    except Exception as e:
+        logger.error(f"✗ Empty data test failed: {e}")
+        return False
+
+
+def run_batch_export_tests():
+    """Run all batch export tests."""
+    logger.info("="*60)
+    logger.info("RUNNING BATCH EXPORT TESTS")
+    logger.info("="*60)
+    
+    results = []
+    
+    logger.info("\n--- Test 1: Matches Individual Exports ---")
+    results.append(test_matches_individual_exports(create_test_midi_data()))
+    
+    logger.info("\n--- Test 2: Empty Data ---")
+    results.append(test_empty_data())
+    
+    # Summary
+    logger.info("\n" + "="*60)
+    passed = sum(results)
+    total = len(results)
+    logger.info(f"Batch Export Tests: {passed}/{total} passed")
+    logger.info("="*60)
+    
+    return all(results)
+
+
+if __name__ == '__main__':
+    success = run_batch_export_tests()
+    sys.exit(0 if success else 1)
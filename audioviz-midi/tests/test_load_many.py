@@ -0,0 +1,104 @@
+# tests/test_load_many.py
+"""
+Tests for AudioLoader.load_many.
+Checks that parallel loading returns the same audio as loading one by one.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from audio import AudioLoader
+from utils import setup_logging, ConfigManager
+import numpy as np
+import soundfile as sf
+
+logger = setup_logging()
+
+
+def create_test_files():
+    """Create short test tones, one at a rate that needs resampling."""
+    logger.info("Creating test audio files...")
+    
+    files = []
+    for i, (freq, sample_rate) in enumerate([(261.63, 22050), (329.63, 44100), (392.00, 22050)]):
+        t = np.arange(int(sample_rate * 1.0)) / sample_rate
+        audio = (0.5 * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+        
+        filename = f'test_load_many_{i}.wav'
+        sf.write(filename, audio, sample_rate)
+        files.append(filename)
+    
+    logger.info(f"Created {len(files)} test files")
+    return files
+
+
+def test_matches_sequential(files):
+    """Test that load_many matches sequential load_audio calls."""
+    logger.info("Comparing load_many with sequential loading...")
+    
+    try:
+        # Decode every file in both paths instead of reading the decode cache
+        config = ConfigManager()
+        config.set('audio', 'cache_decoded', False)
+        loader = AudioLoader(config)
+        
+        expected = [loader.load_audio(f) for f in files]
+        results = loader.load_many(files, max_workers=2)
+        
+        assert len(results) == len(files), f"Wrong result count: {len(results)}"
+        for filename, (audio, sr), (ref_audio, ref_sr) in zip(files, results, expected):
+            assert sr == ref_sr, f"{filename}: sample rate {sr} != {ref_sr}"
+            assert audio.shape == ref_audio.shape, f"{filename}: shape {audio.shape} != {ref_audio.shape}"
+            assert np.array_equal(audio, ref_audio), f"{filename}: samples differ"
+            logger.info(f"✓ {filename}: {len(audio)} samples at {sr} Hz")
+        
+        return True
+    
+    except Exception as e:
+        logger.error(f"✗ load_many comparison failed: {e}")
+        return False
+
+
+def test_missing_file(files):
+    """Test that a missing file raises instead of being skipped."""
+    logger.info("\nTesting load_many with a missing file...")
+    
+    try:
+        AudioLoader().load_many(files + ['nonexistent_file.wav'])
+        logger.error("✗ Missing file did not raise")
+        return False
+    except Exception as e:
+        logger.info(f"✓ Missing file raised: {e}")
+        return True
+
+
+def run_load_many_tests():
+    """Run all load_many tests."""
+    logger.info("="*60)
+    logger.info("RUNNING LOAD_MANY TESTS")
+    logger.info("="*60)
+    
+    files = create_test_files()
+    
+    results = []
+    
+    logger.info("\n--- Test 1: Matches Sequential Loading ---")
+    results.append(test_matches_sequential(files))
+    
+    logger.info("\n--- Test 2: Missing File ---")
+    results.append(test_missing_file(files))
+    
+    # Summary
+    logger.info("\n" + "="*60)
+    passed = sum(results)
+    total = len(results)
+    logger.info(f"load_many Tests: {passed}/{total} passed")
+    logger.info("="*60)
+    
+    return all(results)
+
+
+if __name__ == '__main__':
+    success = run_load_many_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,124 @@
+# tests/test_onset_stream.py
+"""
+Tests for OnsetDetector.detect_onsets_stream.
+Checks streamed onset detection against detect_onsets on the loaded file.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from audio import OnsetDetector
+from utils import setup_logging
+import librosa
+import numpy as np
+import soundfile as sf
+
+logger = setup_logging()
+
+
+def create_test_audio():
+    """Create a note sequence with gaps, long enough to span several blocks."""
+    logger.info("Creating test audio...")
+    
+    sample_rate = 22050
+    frequencies = [261.63, 293.66, 329.63, 349.23, 392.00, 440.00]
+    
+    segments = []
+    for freq in frequencies:
+        t = np.arange(int(sample_rate * 0.5)) / sample_rate
+        envelope = np.exp(-4 * t)
+        segments.append(0.5 * envelope * np.sin(2 * np.pi * freq * t))
+        segments.append(np.zeros(int(sample_rate * 0.1)))
+    
+    audio = np.concatenate(segments).astype(np.float32)
+    sf.write('test_onset_stream.wav', audio, sample_rate)
+    
+    logger.info("Test audio created: test_onset_stream.wav")
+    return 'test_onset_stream.wav'
+
+
+def test_matches_detect_onsets(audio_file):
+    """Test that streamed onsets match detect_onsets with mean aggregation."""
+    logger.info("Comparing detect_onsets_stream with detect_onsets...")
+    
+    try:
+        detector = OnsetDetector()
+        stream_times, _ = detector.detect_onsets_stream(audio_file, block_length=16)
+        
+        # Streaming runs at the file's own rate and averages over mel bands
+        audio_data, sample_rate = librosa.load(audio_file, sr=None)
+        ref_times, _ = detector.detect_onsets(audio_data, sample_rate, aggregate=np.mean)
+        
+        logger.info(f"Streamed: {np.round(stream_times, 3)}")
+        logger.info(f"Reference: {np.round(ref_times, 3)}")
+        
+        assert len(stream_times) == len(ref_times), \
+            f"Onset count {len(stream_times)} != {len(ref_times)}"
+        
+        # The dB floors differ (absolute vs. 80 dB below the peak), which can
+        # move peaks on decaying notes by a couple of frames
+        tolerance = 2 * detector.hop_length / sample_rate
+        max_error = np.max(np.abs(stream_times - ref_times))
+        assert max_error <= tolerance + 1e-6, f"Max onset error {max_error:.3f}s > {tolerance:.3f}s"
+        logger.info(f"✓ {len(stream_times)} onsets, max error {max_error:.3f}s")
+        
+        return True
+    
+    except Exception as e:
+        logger.error(f"✗ Streamed onsets differ: {e}")
+        return False
+
+
+def test_block_length(audio_file):
+    """Test that the onset envelope does not depend on the block length."""
+    logger.info("\nComparing block lengths...")
+    
+    try:
+        detector = OnsetDetector()
+        _, small_env = detector.detect_onsets_stream(audio_file, block_length=8)
+        _, large_env = detector.detect_onsets_stream(audio_file, block_length=256)
+        
+        # Blocks are zero-filled past the end of the file, so only the
+        # frames both envelopes cover are compared
+        n_frames = min(len(small_env), len(large_env))
+        assert np.allclose(small_env[:n_frames], large_env[:n_frames], atol=1e-3), \
+            "Envelopes differ across block boundaries"
+        logger.info(f"✓ Envelopes match over {n_frames} frames")
+        
+        return True
+    
+    except Exception as e:
+        logger.error(f"✗ Block length comparison failed: {e}")
+        return False
+
+
+def run_onset_stream_tests():
+    """Run all streaming onset tests."""
+    logger.info("="*60)
+    logger.info("RUNNING STREAMING ONSET TESTS")
+    logger.info("="*60)
+    
+    audio_file = create_test_audio()
+    
+    results = []
+    
+    logger.info("\n--- Test 1: Matches detect_onsets ---")
+    results.append(test_matches_detect_onsets(audio_file))
+    
+    logger.info("\n--- Test 2: Block Length ---")
+    results.append(test_block_length(audio_file))
+    
+    # Summary
+    logger.info("\n" + "="*60)
+    passed = sum(results)
+    total = len(results)
+    logger.info(f"Streaming Onset Tests: {passed}/{total} passed")
+    logger.info("="*60)
+    
+    return all(results)
+
+
+if __name__ == '__main__':
+    success = run_onset_stream_tests()
+    sys.exit(0 if success else 1)
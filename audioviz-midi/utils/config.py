@@ -21,14 +21,17 @@ class ConfigManager:
             "sample_rate": 22050,
             "hop_length": 512,
             "normalize": True,
-            "mono_conversion": True
+            "mono_conversion": True,
+            "cache_decoded": True,  # Cache decoded audio as .npy files
+            "cache_dir": None  # None = per-user cache dir (e.g. ~/.cache/audioviz-midi)
         },
         "pitch_detection": {
             "algorithm": "piptrack",  # Options: piptrack, pyin
             "fmin": 65.0,  # Lowest frequency (C2 for guitar/piano)
             "fmax": 2093.0,  # Highest frequency (C7)
             "threshold": 0.1,  # Confidence threshold
-            "min_note_duration": 0.05  # Minimum note duration in seconds
+            "min_note_duration": 0.05,  # Minimum note duration in seconds
+            "downsample": True  # Decimate audio to the rate fmax needs before tracking
         },
         "midi": {
             "default_velocity": 80,  # MIDI velocity (0-127)
@@ -59,6 +62,8 @@ class ConfigManager:
         "ui": {
             "window_width": 1920,
             "window_height": 1080,
+            "geometry": None,  # Hex of QMainWindow.saveGeometry(); overrides width/height
+            "center_window": True,  # Set False to leave placement to the window manager
             "theme": "dark",
             "last_directory": ""
         }
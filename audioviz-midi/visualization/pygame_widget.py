@@ -266,6 +266,32 @@ class PygameWidget(QWidget):
             except Exception as e:
                 logger.error(f"Error resizing Pygame surface: {e}")
     
+    def showEvent(self, event):
+        """
+        Resume frame updates when the widget becomes visible.
+        
+        Args:
+            event: QShowEvent
+        """
+        super().showEvent(event)
+        
+        if self.is_initialized and not self.update_timer.isActive():
+            self.update_timer.start()
+            logger.debug("Frame updates resumed")
+    
+    def hideEvent(self, event):
+        """
+        Pause frame updates while the widget is hidden.
+        
+        Args:
+            event: QHideEvent
+        """
+        super().hideEvent(event)
+        
+        if self.update_timer.isActive():
+            self.update_timer.stop()
+            logger.debug("Frame updates paused")
+    
     def cleanup(self):
         """Clean up Pygame resources."""
         if self.is_initialized: